@@ -3,8 +3,9 @@ from __future__ import annotations
 import io
 import json
 import logging
+import sys
 
-from rdflib import Graph
+from rdflib import RDFS, Graph, URIRef
 from rdflib.plugins.sparql.results.jsonresults import JSONResultSerializer
 
 __license__ = """
@@ -55,24 +56,12 @@ class Ontology:
         self.object_properties = self.make_results_set_from_query(
             "SELECT ?p WHERE {?p a <http://www.w3.org/2002/07/owl#ObjectProperty>}", "p")
 
-        self.__person_subtypes = self.make_results_set_from_query(
-            "SELECT ?p WHERE {?p <http://www.w3.org/2000/01/rdf-schema#subClassOf>* <" + self.ies_class(
-                "Person") + ">}", "p")
-        self.__organisation_subtypes = self.make_results_set_from_query(
-            "SELECT ?p WHERE {?p <http://www.w3.org/2000/01/rdf-schema#subClassOf>* <" + self.ies_class(
-                "Organisation") + ">}", "p")
-        self.__event_subtypes = self.make_results_set_from_query(
-            "SELECT ?e WHERE {?e <http://www.w3.org/2000/01/rdf-schema#subClassOf>* <" + self.ies_class(
-                "Event") + ">}", "e")
-        self.__communication_subtypes = self.make_results_set_from_query(
-            "SELECT ?e WHERE {?e <http://www.w3.org/2000/01/rdf-schema#subClassOf>* <" + self.ies_class(
-                "Communication") + ">}", "e")
-        self.geopoint_subtypes = self.make_results_set_from_query(
-            "SELECT ?e WHERE {?e <http://www.w3.org/2000/01/rdf-schema#subClassOf>* <" + self.ies_class(
-                "GeoPoint") + ">}", "e")
-        self.pic_subtypes = self.make_results_set_from_query(
-            "SELECT ?e WHERE {?e <http://www.w3.org/2000/01/rdf-schema#subClassOf>* <" + self.ies_class(
-                "PartyInCommunication") + ">}", "e")
+        self.__person_subtypes = self.subtypes(self.ies_class("Person"))
+        self.__organisation_subtypes = self.subtypes(self.ies_class("Organisation"))
+        self.__event_subtypes = self.subtypes(self.ies_class("Event"))
+        self.__communication_subtypes = self.subtypes(self.ies_class("Communication"))
+        self.geopoint_subtypes = self.subtypes(self.ies_class("GeoPoint"))
+        self.pic_subtypes = self.subtypes(self.ies_class("PartyInCommunication"))
 
         self.classes.add("http://www.w3.org/2000/01/rdf-schema#Class")
         self.classes.add("http://www.w3.org/2000/01/rdf-schema#Property")
@@ -125,14 +114,21 @@ class Ontology:
             return json.loads(f.getvalue())
 
     # pulls out individual variable from each row returned from sparql query. This is a bit niche, I know.
+    # The values are interned so that membership tests against the (also interned) URI constants in ies_tool
+    # can short-circuit on identity.
     def make_results_set_from_query(self, query: str, sparql_var_name: str):
         result_object = self.__run_query(query)
         return_set = set()
         if "results" in result_object.keys() and "bindings" in result_object["results"].keys():
             for binding in result_object["results"]['bindings']:
-                return_set.add(binding[sparql_var_name]['value'])
+                return_set.add(sys.intern(binding[sparql_var_name]['value']))
         return return_set
 
+    # Returns a class and all its transitive subclasses - the equivalent of ?s rdfs:subClassOf* <class_uri>, but
+    # walked directly on the graph so there is no SPARQL query to parse and evaluate
+    def subtypes(self, class_uri: str) -> set:
+        return {sys.intern(str(sub)) for sub in self.graph.transitive_subjects(RDFS.subClassOf, URIRef(class_uri))}
+
         # pulls out individual variable from each row returned from sparql query. It's a bit niche, I know.
     def make_results_dict_from_query(self, query: str, sparql_var_name: str):
         result_object = self.__run_query(query)
@@ -144,18 +140,14 @@ class Ontology:
 
     # Returns the full IES URI for a provided short name of an IES class
     def ies_class(self, short_name: str):
-        short_name.replace("ies:", "")  # just in case someone used the prefix
-
-        if self.ies_uri_stub + short_name not in self.classes:
-            logger.warning(f"class {short_name} not in IES ontology")
-
-        return f"{self.ies_uri_stub}{short_name}"
+        uri = self.ies_uri_stub + short_name.replace("ies:", "")  # just in case someone used the prefix
+        if uri not in self.classes:
+            logger.warning("class %s not in IES ontology", short_name)
+        return uri
 
     # Returns the full IES URI for a provided short name of an IES property
     def ies_property(self, short_name: str):
-        short_name.replace("ies:", "")  # just in case someone used the prefix
-
-        if self.ies_uri_stub + short_name not in self.properties:
-            logger.warning(f"property {short_name} not in IES ontology")
-
-        return f"{self.ies_uri_stub}{short_name}"
+        uri = self.ies_uri_stub + short_name.replace("ies:", "")  # just in case someone used the prefix
+        if uri not in self.properties:
+            logger.warning("property %s not in IES ontology", short_name)
+        return uri
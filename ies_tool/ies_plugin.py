@@ -41,6 +41,14 @@ class IESPlugin:
     def add_triple(self, subject: str, predicate: str, obj: str, is_literal: bool, literal_type: str):
         raise NotImplementedError
 
+    def add_triples(self, triples: list[tuple]):
+        # triples are (subject, predicate, obj, is_literal, literal_type) tuples - override if the storage engine
+        # has a faster bulk load
+        for subject, predicate, obj, is_literal, literal_type in triples:
+            self.add_triple(
+                subject=subject, predicate=predicate, obj=obj, is_literal=is_literal, literal_type=literal_type
+            )
+
     def can_validate(self) -> bool:
         raise NotImplementedError
 
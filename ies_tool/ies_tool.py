@@ -1,28 +1,35 @@
 from __future__ import annotations
 
-import io
+import concurrent.futures
+import contextlib
+import functools
 import json
 import logging
 import os
 import pathlib
+import re
+import sys
+import types
 import uuid
 import warnings
+from collections.abc import Iterable
 from typing import TypeVar
 
-import iso4217parse
 import phonenumbers
 import pycountry
-import requests
 import validators
-import validators.uri
-from geohash_tools import encode
-from pyshacl import validate as pyshacl_validate
 from rdflib import XSD, Graph, Literal, Namespace, URIRef
+from rdflib.plugins.sparql import prepareQuery
 
 from ies_tool.ies_ontology import IES_BASE, Ontology
 from ies_tool.ies_plugin import IESPlugin
 from ies_tool.utils import validate_datetime_string
 
+try:
+    import orjson
+except ImportError:  # orjson is optional - the standard library parser gives the same result, more slowly
+    orjson = None
+
 __license__ = """
 Copyright TELICENT LTD
 
@@ -52,49 +59,296 @@ RDFS_CLASS = "http://www.w3.org/2000/01/rdf-schema#Class"
 
 TELICENT_PRIMARY_NAME = "http://telicent.io/ontology/primaryName"
 
-EXCHANGED_ITEM = f"{IES_BASE}ExchangedItem"
-ELEMENT = f"{IES_BASE}Element"
-CLASS_OF_ELEMENT = f"{IES_BASE}ClassOfElement"
-CLASS_OF_CLASS_OF_ELEMENT = f"{IES_BASE}ClassOfClassOfElement"
-PARTICULAR_PERIOD = f"{IES_BASE}ParticularPeriod"
-ACCOUNT = f"{IES_BASE}Account"
-ACCOUNT_HOLDER = f"{IES_BASE}AccountHolder"
-ACCOUNT_STATE = f"{IES_BASE}AccountState"
-AMOUNT_OF_MONEY = f"{IES_BASE}AmountOfMoney"
-ASSET = f"{IES_BASE}Asset"
-ASSET_STATE = f"{IES_BASE}AssetState"
-COMMUNICATIONS_ACCOUNT = f"{IES_BASE}CommunicationsAccount"
-COMMUNICATIONS_ACCOUNT_STATE = f"{IES_BASE}CommunicationsAccountState"
-HOLDS_ACCOUNT = f"{IES_BASE}holdsAccount"
-PROVIDES_ACCOUNT = f"{IES_BASE}providesAccount"
-STATE = f"{IES_BASE}State"
-BOUNDING_STATE = f"{IES_BASE}BoundingState"
-BIRTH_STATE = f"{IES_BASE}BirthState"
-DEATH_STATE = f"{IES_BASE}DeathState"
-UNIT_OF_MEASURE = f"{IES_BASE}UnitOfMeasure"
-MEASURE_VALUE = f"{IES_BASE}MeasureValue"
-MEASURE = f"{IES_BASE}Measure"
-REPRESENTATION = f"{IES_BASE}Representation"
-IDENTIFIER = f"{IES_BASE}Identifier"
-NAME = f"{IES_BASE}Name"
-NAMING_SCHEME = f"{IES_BASE}NamingScheme"
-ENTITY = f"{IES_BASE}Entity"
-DEVICE_STATE = f"{IES_BASE}DeviceState"
-DEVICE = f"{IES_BASE}Device"
-LOCATION = f"{IES_BASE}Location"
-LOCATION_STATE = f"{IES_BASE}#LocationState"
-COUNTRY = f"{IES_BASE}Country"
-GEOPOINT = f"{IES_BASE}GeoPoint"
-RESPONSIBLE_ACTOR = f"{IES_BASE}ResponsibleActor"
-POST = f"{IES_BASE}Post"
-PERSON = f"{IES_BASE}Person"
-ORGANISATION = f"{IES_BASE}Organisation"
-ORGANISATION_NAME = f"{IES_BASE}OrganisationName"
-EVENT = f"{IES_BASE}Event"
-EVENT_PARTICIPANT = f"{IES_BASE}EventParticipant"
-COMMUNICATION = f"{IES_BASE}Communication"
-PARTY_IN_COMMUNICATION = f"{IES_BASE}PartyInCommunication"
-WORK_OF_DOCUMENTATION = f"{IES_BASE}WorkOfDocumentation"
+ISO3166 = "http://iso.org/iso3166#"
+ISO8601 = "http://iso.org/iso8601#"
+
+# Connections kept open to a SPARQL server in sparql_server mode
+SPARQL_POOL_SIZE = 32
+# Queries longer than this are POSTed as a form rather than sent in the URL, where they would risk the URL length
+# limits of proxies and servers
+SPARQL_GET_QUERY_LIMIT = 2000
+# Seconds to wait for a SPARQL server to answer the connection check made when an IESTool is created
+SPARQL_CONNECT_TIMEOUT = 5.0
+# Most dependent-URI stems recorded before the record is reset. Losing a stem's count is harmless - minting just
+# probes upwards from 001 again - so this bounds the memory used by long-running tools that mint for many parents
+STEM_COUNTER_LIMIT = 100_000
+GEOHASH = "http://geohash.org/"
+
+# The IES class and property URIs are interned, as they are compared and hashed on nearly every triple added
+EXCHANGED_ITEM = sys.intern(f"{IES_BASE}ExchangedItem")
+ELEMENT = sys.intern(f"{IES_BASE}Element")
+CLASS_OF_ELEMENT = sys.intern(f"{IES_BASE}ClassOfElement")
+CLASS_OF_CLASS_OF_ELEMENT = sys.intern(f"{IES_BASE}ClassOfClassOfElement")
+PARTICULAR_PERIOD = sys.intern(f"{IES_BASE}ParticularPeriod")
+ACCOUNT = sys.intern(f"{IES_BASE}Account")
+ACCOUNT_HOLDER = sys.intern(f"{IES_BASE}AccountHolder")
+ACCOUNT_STATE = sys.intern(f"{IES_BASE}AccountState")
+AMOUNT_OF_MONEY = sys.intern(f"{IES_BASE}AmountOfMoney")
+ASSET = sys.intern(f"{IES_BASE}Asset")
+ASSET_STATE = sys.intern(f"{IES_BASE}AssetState")
+COMMUNICATIONS_ACCOUNT = sys.intern(f"{IES_BASE}CommunicationsAccount")
+COMMUNICATIONS_ACCOUNT_STATE = sys.intern(f"{IES_BASE}CommunicationsAccountState")
+HOLDS_ACCOUNT = sys.intern(f"{IES_BASE}holdsAccount")
+PROVIDES_ACCOUNT = sys.intern(f"{IES_BASE}providesAccount")
+STATE = sys.intern(f"{IES_BASE}State")
+BOUNDING_STATE = sys.intern(f"{IES_BASE}BoundingState")
+BIRTH_STATE = sys.intern(f"{IES_BASE}BirthState")
+DEATH_STATE = sys.intern(f"{IES_BASE}DeathState")
+UNIT_OF_MEASURE = sys.intern(f"{IES_BASE}UnitOfMeasure")
+MEASURE_VALUE = sys.intern(f"{IES_BASE}MeasureValue")
+MEASURE = sys.intern(f"{IES_BASE}Measure")
+REPRESENTATION = sys.intern(f"{IES_BASE}Representation")
+IDENTIFIER = sys.intern(f"{IES_BASE}Identifier")
+NAME = sys.intern(f"{IES_BASE}Name")
+NAMING_SCHEME = sys.intern(f"{IES_BASE}NamingScheme")
+ENTITY = sys.intern(f"{IES_BASE}Entity")
+DEVICE_STATE = sys.intern(f"{IES_BASE}DeviceState")
+DEVICE = sys.intern(f"{IES_BASE}Device")
+LOCATION = sys.intern(f"{IES_BASE}Location")
+LOCATION_STATE = sys.intern(f"{IES_BASE}LocationState")
+COUNTRY = sys.intern(f"{IES_BASE}Country")
+GEOPOINT = sys.intern(f"{IES_BASE}GeoPoint")
+RESPONSIBLE_ACTOR = sys.intern(f"{IES_BASE}ResponsibleActor")
+POST = sys.intern(f"{IES_BASE}Post")
+PERSON = sys.intern(f"{IES_BASE}Person")
+ORGANISATION = sys.intern(f"{IES_BASE}Organisation")
+ORGANISATION_NAME = sys.intern(f"{IES_BASE}OrganisationName")
+EVENT = sys.intern(f"{IES_BASE}Event")
+EVENT_PARTICIPANT = sys.intern(f"{IES_BASE}EventParticipant")
+COMMUNICATION = sys.intern(f"{IES_BASE}Communication")
+PARTY_IN_COMMUNICATION = sys.intern(f"{IES_BASE}PartyInCommunication")
+WORK_OF_DOCUMENTATION = sys.intern(f"{IES_BASE}WorkOfDocumentation")
+ACCOUNT_IN_COMMUNICATION = sys.intern(f"{IES_BASE}AccountInCommunication")
+ACCOUNT_NUMBER = sys.intern(f"{IES_BASE}AccountNumber")
+CALLSIGN = sys.intern(f"{IES_BASE}Callsign")
+CURRENCY = sys.intern(f"{IES_BASE}Currency")
+DEVICE_IN_COMMUNICATION = sys.intern(f"{IES_BASE}DeviceInCommunication")
+EMAIL_ADDRESS = sys.intern(f"{IES_BASE}EmailAddress")
+GIVEN_NAME = sys.intern(f"{IES_BASE}GivenName")
+IMSI = sys.intern(f"{IES_BASE}IMSI")
+IP_ADDRESS = sys.intern(f"{IES_BASE}IPAddress")
+IPV4_ADDRESS = sys.intern(f"{IES_BASE}IPv4Address")
+IPV6_ADDRESS = sys.intern(f"{IES_BASE}IPv6Address")
+ISO3166_1_ALPHA_3 = sys.intern(f"{IES_BASE}ISO3166_1Alpha_3")
+IN_POST = sys.intern(f"{IES_BASE}InPost")
+LATITUDE = sys.intern(f"{IES_BASE}Latitude")
+LONGITUDE = sys.intern(f"{IES_BASE}Longitude")
+MAC_ADDRESS = sys.intern(f"{IES_BASE}MACAddress")
+ORGANISATION_STATE = sys.intern(f"{IES_BASE}OrganisationState")
+PERSON_IN_COMMUNICATION = sys.intern(f"{IES_BASE}PersonInCommunication")
+PERSON_STATE = sys.intern(f"{IES_BASE}PersonState")
+PLACE_NAME = sys.intern(f"{IES_BASE}PlaceName")
+RESPONSIBLE_ACTOR_STATE = sys.intern(f"{IES_BASE}ResponsibleActorState")
+SURNAME = sys.intern(f"{IES_BASE}Surname")
+TELEPHONE_NUMBER = sys.intern(f"{IES_BASE}TelephoneNumber")
+
+ALL_HAVE_CHARACTERISTIC = sys.intern(f"{IES_BASE}allHaveCharacteristic")
+CURRENCY_AMOUNT = sys.intern(f"{IES_BASE}currencyAmount")
+CURRENCY_DENOMINATION = sys.intern(f"{IES_BASE}currencyDenomination")
+HAS_ACCESS_TO = sys.intern(f"{IES_BASE}hasAccessTo")
+HAS_CHARACTERISTIC = sys.intern(f"{IES_BASE}hasCharacteristic")
+HAS_NAME = sys.intern(f"{IES_BASE}hasName")
+HAS_REGISTERED_COMMS_ID = sys.intern(f"{IES_BASE}hasRegisteredCommsID")
+HAS_VALUE = sys.intern(f"{IES_BASE}hasValue")
+IN_LOCATION = sys.intern(f"{IES_BASE}inLocation")
+IN_PERIOD = sys.intern(f"{IES_BASE}inPeriod")
+IN_POSSESSION_OF = sys.intern(f"{IES_BASE}inPossessionOf")
+IN_SCHEME = sys.intern(f"{IES_BASE}inScheme")
+ISO8601_PERIOD_REPRESENTATION = sys.intern(f"{IES_BASE}iso8601PeriodRepresentation")
+IS_END_OF = sys.intern(f"{IES_BASE}isEndOf")
+IS_IDENTIFIED_BY = sys.intern(f"{IES_BASE}isIdentifiedBy")
+IS_PARTICIPANT_IN = sys.intern(f"{IES_BASE}isParticipantIn")
+IS_PARTICIPATION_OF = sys.intern(f"{IES_BASE}isParticipationOf")
+IS_PART_OF = sys.intern(f"{IES_BASE}isPartOf")
+IS_REPRESENTED_AS = sys.intern(f"{IES_BASE}isRepresentedAs")
+IS_START_OF = sys.intern(f"{IES_BASE}isStartOf")
+IS_STATE_OF = sys.intern(f"{IES_BASE}isStateOf")
+MEASURE_UNIT = sys.intern(f"{IES_BASE}measureUnit")
+MESSAGE_CONTENT = sys.intern(f"{IES_BASE}messageContent")
+OWNS = sys.intern(f"{IES_BASE}owns")
+REPRESENTATION_VALUE = sys.intern(f"{IES_BASE}representationValue")
+SCHEME_MASTERED_IN = sys.intern(f"{IES_BASE}schemeMasteredIn")
+SCHEME_OWNER = sys.intern(f"{IES_BASE}schemeOwner")
+USER_OF = sys.intern(f"{IES_BASE}userOf")
+WORKS_FOR = sys.intern(f"{IES_BASE}worksFor")
+
+# Loose check (one @, no whitespace, a dot in the domain), but the address is appended to rfc5322: to mint a URI,
+# so it must not contain any character that is illegal in an IRI - otherwise the whole graph fails to serialise
+EMAIL_ADDRESS_PATTERN = re.compile(r'[^@\s<>"{}|\\^`]+@[^@\s<>"{}|\\^`]+\.[^@\s<>"{}|\\^`]+')
+
+@functools.lru_cache(maxsize=65536)
+def _e164(telephone_number: str) -> str:
+    # Parsing and formatting are the expensive part of registering a phone number, and the same numbers tend to
+    # recur across a dataset. Unparseable numbers raise, so are never cached.
+    return phonenumbers.format_number(phonenumbers.parse(telephone_number, None), phonenumbers.PhoneNumberFormat.E164)
+
+
+GEOHASH_BASE32 = "0123456789bcdefghjkmnpqrstuvwxyz"
+
+
+def _encode_geohash(lat: float, lon: float, precision: int) -> str:
+    """
+    Encodes a lat/lon as a geohash. This gives exactly the same hashes as geohash_tools.encode (including which side
+    of a cell boundary a point falls), but packs the bits into integers rather than building and re-parsing a
+    string of binary digits, which makes it many times faster when minting lots of GeoPoints.
+
+    Args:
+        lat (float): latitude in decimal degrees
+        lon (float): longitude in decimal degrees
+        precision (int): number of characters in the geohash
+
+    Returns:
+        str: the geohash
+    """
+    if abs(lat) > 90:
+        raise ValueError("Invalid latitude")
+    if abs(lon) > 180:
+        raise ValueError("Invalid longitude")
+    lat_low, lat_high = -90.0, 90.0
+    lon_low, lon_high = -180.0, 180.0
+    is_lon = True
+    chars = []
+    for _ in range(precision):
+        index = 0
+        for _ in range(5):
+            if is_lon:
+                mid = (lon_low + lon_high) / 2
+                if lon > mid:
+                    index = (index << 1) | 1
+                    lon_low = mid
+                else:
+                    index <<= 1
+                    lon_high = mid
+            else:
+                mid = (lat_low + lat_high) / 2
+                if lat > mid:
+                    index = (index << 1) | 1
+                    lat_low = mid
+                else:
+                    index <<= 1
+                    lat_high = mid
+            is_lon = not is_lon
+        chars.append(GEOHASH_BASE32[index])
+    return "".join(chars)
+
+
+@functools.lru_cache(maxsize=None)  # noqa: UP033 - functools.cache needs Python 3.9
+def _country_names_by_alpha_3() -> dict[str, str]:
+    # Built once, on first use, so importing ies_tool doesn't pay for loading the pycountry database
+    return {country.alpha_3: country.name for country in pycountry.countries}
+
+
+@functools.lru_cache(maxsize=None)  # noqa: UP033 - functools.cache needs Python 3.9
+def _load_ontology(filename: str) -> Ontology:
+    # IESTool only ever reads the ontology, so each file is parsed once per process and shared by every tool
+    return Ontology(filename)
+
+
+@functools.lru_cache(maxsize=None)  # noqa: UP033 - functools.cache needs Python 3.9
+def _xsd_datatype(literal_type: str) -> URIRef:
+    # Attribute lookups on rdflib's XSD namespace are slow, and only a handful of literal types are ever used
+    if isinstance(literal_type, URIRef):
+        return literal_type
+    try:
+        return getattr(XSD, literal_type)
+    except AttributeError:
+        return XSD.string
+
+
+@functools.lru_cache(maxsize=None)  # noqa: UP033 - functools.cache needs Python 3.9
+def _sparql_datatype(literal_type: str) -> str:
+    # The bracketed datatype IRI that follows ^^ in a SPARQL literal - a bare name like ^^string is not valid SPARQL
+    return f"<{_xsd_datatype(literal_type)}>"
+
+
+# Escapes that are valid in both SPARQL and N-Triples string literals. rdflib's Literal.n3() can't be used for this:
+# it writes strings containing a newline as """long""" literals, which N-Triples doesn't allow
+_LITERAL_ESCAPES = str.maketrans({"\\": "\\\\", '"': '\\"', "\n": "\\n", "\r": "\\r"})
+
+
+def _literal_term(obj: str, literal_type: str | None) -> str:
+    # A quoted (and escaped) literal, typed if literal_type is given, for use in SPARQL updates and N-Triples
+    term = f'"{str(obj).translate(_LITERAL_ESCAPES)}"'
+    if literal_type:
+        term = f'{term}^^{_sparql_datatype(literal_type)}'
+    return term
+
+
+# Predicates (and the classes used as rdf:type objects) come from a small vocabulary that recurs on almost every
+# triple, so their rdflib terms are built once and reused rather than re-created per call. The cache is bounded, as
+# data-driven predicates would otherwise make it grow without limit
+@functools.lru_cache(maxsize=4096)
+def _vocab_ref(uri: str) -> URIRef:
+    return URIRef(uri)
+
+
+def _uri_ref(uri: str) -> URIRef:
+    return uri if type(uri) is URIRef else URIRef(uri)
+
+
+# SPARQL JSON results can run to megabytes, so they are parsed with orjson when it is installed
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+
+@functools.lru_cache(maxsize=256)
+def _prepared_query(query: str):
+    # Parsing a query (including its PREFIX preamble) takes a few milliseconds, far longer than running it against
+    # a typical in-memory graph, so repeated queries reuse the parsed form
+    return prepareQuery(query)
+
+
+# A scheme followed by characters that are legal in an RDF IRI. Unlike validators.url this accepts URNs and
+# single-label hosts (e.g. http://localhost/...), and it costs a fraction of a microsecond rather than ~14us per URI
+_URI_RE = re.compile(r'[A-Za-z][A-Za-z0-9+\-.]*:[^\s<>"{}|\\^`]+', re.ASCII)
+
+
+def _is_uri(uri: str) -> bool:
+    return _URI_RE.fullmatch(uri) is not None
+
+
+# The XSD datatypes that can be used as a literal_type. A frozenset, as it is only ever used for membership tests
+XSD_DATATYPES = frozenset({
+    "string",  # Character strings (but not all Unicode character strings)
+    "boolean",  # true / false
+    "decimal",  # Arbitrary-precision decimal numbers
+    "integer",  # Arbitrary-size integer numbers
+    "double",  # 64-bit floating point numbers incl. ±Inf, ±0, NaN
+    "float",  # 32-bit floating point numbers incl. ±Inf, ±0, NaN
+    "date",  # Dates (yyyy-mm-dd) with or without timezone
+    "time",  # Times (hh:mm:ss.sss…) with or without timezone
+    "dateTime",  # Date and time with or without timezone
+    "dateTimeStamp",  # Date and time with required timezone
+    "gYear",  # Gregorian calendar year
+    "gMonth",  # Gregorian calendar month
+    "gDay",  # Gregorian calendar day of the month
+    "gYearMonth",  # Gregorian calendar year and month
+    "gMonthDay",  # Gregorian calendar month and day
+    "duration",  # Duration of time
+    "yearMonthDuration",  # Duration of time (months and years only)
+    "dayTimeDuration",  # Duration of time (days, hours, minutes, seconds only)
+    "byte",  # -128…+127 (8 bit)
+    "short",  # -32768…+32767 (16 bit)
+    "int",  # -2147483648…+2147483647 (32 bit)
+    "long",  # -9223372036854775808…+9223372036854775807 (64 bit)
+    "unsignedByte",  # 0…255 (8 bit)
+    "unsignedShort",  # 0…65535 (16 bit)
+    "unsignedInt",  # 0…4294967295 (32 bit)
+    "unsignedLong",  # 0…18446744073709551615 (64 bit)
+    "positiveInteger",  # Integer numbers >0
+    "nonNegativeInteger",  # Integer numbers ≥0
+    "negativeInteger",  # Integer numbers <0
+    "nonPositiveInteger",  # Integer numbers ≤0
+    "hexBinary",  # Hex-encoded binary data
+    "base64Binary",  # Base64-encoded binary data
+    "anyURI",  # Absolute or relative URIs and IRIs
+    "language",  # Language tags per [BCP47]
+    "normalizedString",  # Whitespace-normalized strings
+    "token",  # Tokenized strings
+    "NMTOKEN",  # XML NMTOKENs
+    "Name",  # XML Names
+    "NCName",  # XML non-colonised names
+})
+
 
 DEFAULT_PREFIXES = {
     "xsd:": "http://www.w3.org/2001/XMLSchema#",
@@ -103,7 +357,7 @@ DEFAULT_PREFIXES = {
     "rdfs:": "http://www.w3.org/2000/01/rdf-schema#",
     "owl:": "http://www.w3.org/2002/07/owl#",
     "iso8601:": "http://iso.org/iso8601#",
-    "iso3166:": "http://iso.org/iso3166#",
+    "iso3166:": ISO3166,
     "iso4217:": "http://iso.org/iso4217#",
     "tont:": "http://telicent.io/ontology/",
     "e164:": "https://www.itu.int/e164#",
@@ -133,7 +387,8 @@ class IESTool:
     def __init__(
             self, default_data_namespace: str = "http://example.com/rdf/testdata#", mode: str = "rdflib",
             plug_in: IESPlugin | None = None, validate: bool = False, server_host: str = "http://localhost:3030/",
-            server_dataset: str = "ds", default_security_label: str | None = None
+            server_dataset: str = "ds", default_security_label: str | None = None,
+            sparql_batch_size: int | None = None, graph_store_upload: bool = False
     ):
         """
 
@@ -154,6 +409,16 @@ class IESTool:
                 For use in sparql_server mode, the host URI of the triplestore
             server_dataset (str):
                 For use in sparql_server mode, the name of the triplestore dataset you want to work on
+            sparql_batch_size (int):
+                For use in sparql_server mode - if set, triples are held back and sent to the triplestore in one
+                INSERT DATA update per this many triples, rather than one update per add_triple() call. Anything
+                still held back is sent by flush(), which also runs before every query, update and in_graph() check.
+                Call flush() once you have finished adding data - triples still held back when the tool is garbage
+                collected are lost (a warning is logged)
+            graph_store_upload (bool):
+                For use in sparql_server mode - if true, added triples are POSTed as N-Triples to the dataset's Graph
+                Store Protocol endpoint, which the triplestore can load without parsing and planning a SPARQL update.
+                If the endpoint turns out not to accept them, IES Tool falls back to INSERT DATA updates
         """
 
         # Instances dict is used as a local cache for all instances created. It's a bit wasteful, but it does
@@ -164,47 +429,7 @@ class IESTool:
         self.plug_in: IESPlugin | None = None
 
         # Lookup for XSD datatypes
-        self.xsdDatatypes = [
-            "string",  # Character strings (but not all Unicode character strings)
-            "boolean",  # true / false
-            "decimal",  # Arbitrary-precision decimal numbers
-            "integer",  # Arbitrary-size integer numbers
-            "double",  # 64-bit floating point numbers incl. ±Inf, ±0, NaN
-            "float",  # 32-bit floating point numbers incl. ±Inf, ±0, NaN
-            "date",  # Dates (yyyy-mm-dd) with or without timezone
-            "time",  # Times (hh:mm:ss.sss…) with or without timezone
-            "dateTime",  # Date and time with or without timezone
-            "dateTimeStamp",  # Date and time with required timezone
-            "gYear",  # Gregorian calendar year
-            "gMonth",  # Gregorian calendar month
-            "gDay",  # Gregorian calendar day of the month
-            "gYearMonth",  # Gregorian calendar year and month
-            "gMonthDay",  # Gregorian calendar month and day
-            "duration",  # Duration of time
-            "yearMonthDuration",  # Duration of time (months and years only)
-            "dayTimeDuration",  # Duration of time (days, hours, minutes, seconds only)
-            "byte",  # -128…+127 (8 bit)
-            "short",  # -32768…+32767 (16 bit)
-            "int",  # -2147483648…+2147483647 (32 bit)
-            "long",  # -9223372036854775808…+9223372036854775807 (64 bit)
-            "unsignedByte",  # 0…255 (8 bit)
-            "unsignedShort",  # 0…65535 (16 bit)
-            "unsignedInt",  # 0…4294967295 (32 bit)
-            "unsignedLong",  # 0…18446744073709551615 (64 bit)
-            "positiveInteger",  # Integer numbers >0
-            "nonNegativeInteger",  # Integer numbers ≥0
-            "negativeInteger",  # Integer numbers <0
-            "nonPositiveInteger",  # Integer numbers ≤0
-            "hexBinary",  # Hex-encoded binary data
-            "base64Binary",  # Base64-encoded binary data
-            "anyURI",  # Absolute or relative URIs and IRIs
-            "language",  # Language tags per [BCP47]
-            "normalizedString",  # Whitespace-normalized strings
-            "token",  # Tokenized strings
-            "NMTOKEN",  # XML NMTOKENs
-            "Name",  # XML Names
-            "NCName"
-        ]
+        self.xsdDatatypes = XSD_DATATYPES
 
         # Property initialisations
 
@@ -213,11 +438,9 @@ class IESTool:
         self.session_uuid = None
         self.current_dir = pathlib.Path(__file__).parent.resolve()
 
-        local_folder = os.path.dirname(os.path.realpath(__file__))
-        ont_file = os.path.join(local_folder, "ies4.ttl")
-        self.ontology = Ontology(ont_file)
 
         self.__mode = mode
+        self.__validate = False
         if mode not in ["rdflib", "sparql_server"]:
             self._register_plugin(mode, plug_in)
 
@@ -230,25 +453,53 @@ class IESTool:
             if not validate:
                 logger.warning('Enabling validation for rdflib mode')
             self.__validate = True
-            self._init_shacl(os.path.join(self.current_dir, "ies_r4_2_0.shacl"))
+            self._shacl_filename = os.path.join(self.current_dir, "ies_r4_2_0.shacl")
             logger.info("IES Tool set to validate all messages. This might get a bit slow")
         elif mode == "sparql_server":
             self.server_host = server_host
             self.server_dataset = server_dataset
             self.default_security_label = default_security_label or ""
+            self._query_uri = f"{server_host}{server_dataset}/query"
+            self._update_uri = f"{server_host}{server_dataset}/update"
+            self._graph_store_uri = f"{server_host}{server_dataset}/data?default"
+            # One session for all requests to the triplestore, so the connection is kept alive and reused rather
+            # than re-established for every query and update. Queries that hit a transient gateway error are retried
+            # (urllib3 doesn't retry POSTs, so updates are never sent twice). requests is only needed in this mode, so
+            # it is imported here rather than slowing down every import of ies_tool
+            import requests
+            from requests.adapters import HTTPAdapter
+            from urllib3.util.retry import Retry
+
+            self._http = requests.Session()
+            adapter = HTTPAdapter(
+                pool_maxsize=SPARQL_POOL_SIZE,
+                max_retries=Retry(total=3, backoff_factor=0.2, status_forcelist=[502, 503, 504])
+            )
+            self._http.mount("http://", adapter)
+            self._http.mount("https://", adapter)
             try:
-                query = "SELECT * WHERE { ?s ?p ?o } LIMIT 2"
-                get_uri = self.server_host + self.server_dataset + "/query?query=" + query
-                requests.get(get_uri)
-            except ConnectionError as e:
+                # ASK {} checks the endpoint is there without touching any data, and the timeout stops a hung server
+                # from blocking construction indefinitely
+                self._http.get(self._query_uri, params={"query": "ASK {}"}, timeout=SPARQL_CONNECT_TIMEOUT)
+            except requests.RequestException as e:
                 raise RuntimeError(f"Could not connect to SPARQL endpoint at {self.server_host}") from e
 
         logger.debug("initialising data graph")
 
         # Note that both plugin and rdflib datasets are initialised to enable quick changeover
         self.graph = Graph()
+        # While batch() is active, triples are held here (keyed by security label) rather than written straight away
+        self._triple_buffer: dict[str, list[tuple]] | None = None
+        if self.__mode == "sparql_server" and sparql_batch_size:
+            # An HTTP round trip per triple dominates bulk loads, so the buffer is left open for the tool's lifetime
+            self._triple_buffer = {}
+            self._buffered_triple_count = 0
+            self._batch_flush_every = sparql_batch_size
+        self._graph_store_upload = self.__mode == "sparql_server" and graph_store_upload
 
         self.prefixes: dict[str, str] = {}
+        self._formatted_prefixes: str | None = None
+        self._generated_uri_prefix: str | None = None
         self.default_data_namespace = default_data_namespace
 
         # Establish a set of useful prefixes
@@ -259,19 +510,41 @@ class IESTool:
             self.clear_graph()
 
         self.ies_namespace = IES_BASE
-        self.iso8601_namespace = "http://iso.org/iso8601#"
+        self.iso8601_namespace = ISO8601
+        self.e164_namespace = self.prefixes["e164:"]
+        self.rfc5322_namespace = self.prefixes["rfc5322:"]
+        self.imsi_namespace = self.prefixes["IMSI:"]
+        self.ieee802_namespace = self.prefixes["ieee802:"]
+        self.iso4217_namespace = self.prefixes["iso4217:"]
         self.rdf_type = f"{self.prefixes['rdf:']}type"
         self.rdfs_resource = f"{self.prefixes['rdfs:']}Resource"
         self.rdfs_comment = f"{self.prefixes['rdfs:']}comment"
         self.rdfs_label = f"{self.prefixes['rdfs:']}label"
 
-        self.__validate = False
-
-        # Create a layered dictionary of base classes, along with their corresponding IES subclasses.
-        # This enables look up of most appropriate base class when call instantiate
-        # This may be better if it was in the ies_ontology library, but they don't have access to
-        # the class definitions and didn't want to create a circular dependency...again
-        self.base_classes = self._all_python_subclasses({}, RdfsResource, 0)
+    def __del__(self):
+        # Flushing here would mean network I/O during garbage collection (or interpreter shutdown), so unflushed
+        # sparql_batch_size triples are reported rather than sent
+        if getattr(self, "_triple_buffer", None):
+            logger.warning("IESTool discarded %s triples that were never flushed - call flush() after adding data",
+                           self._buffered_triple_count)
+
+    # The ontology and the class hierarchy derived from it are loaded on first use, so creating an IESTool (and
+    # importing this module, which creates IES_TOOL) doesn't pay for parsing ies4.ttl until it is needed
+    @functools.cached_property
+    def ontology(self) -> Ontology:
+        return _load_ontology(os.path.join(self.current_dir, "ies4.ttl"))
+
+    # Create a layered dictionary of base classes, along with their corresponding IES subclasses.
+    # This enables look up of most appropriate base class when call instantiate
+    # This may be better if it was in the ies_ontology library, but they don't have access to
+    # the class definitions and didn't want to create a circular dependency...again
+    @functools.cached_property
+    def base_classes(self) -> dict:
+        return self._all_python_subclasses({}, RdfsResource, 0)
+
+    @functools.cached_property
+    def _base_class_index(self) -> dict:
+        return self._index_base_classes()
 
     @property
     def default_data_namespace(self):
@@ -281,6 +554,14 @@ class IESTool:
     def default_data_namespace(self, value):
         self.add_prefix(":", value)
 
+    # The prefix shared by all URIs produced by generate_data_uri() in the current session. It is cached until the
+    # default data namespace or the session changes
+    @property
+    def generated_uri_prefix(self) -> str:
+        if self._generated_uri_prefix is None:
+            self._generated_uri_prefix = f"{self.default_data_namespace}{self.session_uuid_str}"
+        return self._generated_uri_prefix
+
     def add_prefix(self, prefix: str, uri: str):
         """
         Adds an RDF prefix to the internal list of namespace prefixes. If using rdflib for the in-memory graph,
@@ -298,30 +579,40 @@ class IESTool:
             prefix = prefix + ":"
 
         self.prefixes[prefix] = uri
+        self._formatted_prefixes = None
+        if prefix == ":":
+            self._generated_uri_prefix = None
         if self.__mode == "rdflib":
             ns = Namespace(uri)
             self.graph.bind(prefix.replace(":", ""), ns)
 
     def _mint_dependent_uri(self, parent_uri: str, postfix: str) -> str:
-        new_uri = f'{parent_uri}_{postfix}_001'
-        counter = 1
-        while new_uri in self.instances:
+        return self._mint_uri_from_stem(f'{parent_uri}_{postfix}_')
+
+    def _mint_uri_from_stem(self, stem: str) -> str:
+        # Carry on from the last number minted for this stem, rather than probing upwards from 1 every time
+        counter = self._stem_counters.get(stem, 0) + 1
+        new_uri = f'{stem}{counter:03d}'
+        while new_uri in self.instances:  # the caller may have supplied URIs that follow the same pattern
             counter += 1
-            new_uri = f'{parent_uri}_{postfix}_{counter:03d}'
+            new_uri = f'{stem}{counter:03d}'
+        if len(self._stem_counters) >= STEM_COUNTER_LIMIT and stem not in self._stem_counters:
+            self._stem_counters.clear()
+        self._stem_counters[stem] = counter
         return new_uri
 
     def format_prefixes(self) -> str:
         """
-        Returns the prefixes held in IESTool, formatted for use in SPARQL queries
+        Returns the prefixes held in IESTool, formatted for use in SPARQL queries. The result is cached until the
+        next add_prefix() call, so prefixes should always be added that way rather than via self.prefixes.
 
         Returns:
             str: The formatted prefixes
         """
 
-        prefix_str = ''
-        for prefix in self.prefixes:
-            prefix_str = f"{prefix_str}PREFIX {prefix} <{self.prefixes[prefix]}> "
-        return prefix_str
+        if self._formatted_prefixes is None:
+            self._formatted_prefixes = "".join(f"PREFIX {prefix} <{uri}> " for prefix, uri in self.prefixes.items())
+        return self._formatted_prefixes
 
     def _all_python_subclasses(self, hierarchy: dict, cls: Unique, level: int) -> dict:
         """_summary_
@@ -341,8 +632,7 @@ class IESTool:
             uri = cls.__name__.replace("Rdfs", RDFS)
         else:
             uri = IES_BASE + cls.__name__
-        ies_subs = self.ontology.make_results_set_from_query(
-            "SELECT ?p WHERE {?p <http://www.w3.org/2000/01/rdf-schema#subClassOf>* <" + uri + ">}", "p")
+        ies_subs = self.ontology.subtypes(uri)
         hierarchy[level][uri] = {'python_class': cls, 'ies_subclasses': list(ies_subs)}
         subclasses = cls.__subclasses__()
         if len(subclasses) > 0:
@@ -353,16 +643,27 @@ class IESTool:
     # Given an IES or RDFS class, this function will attempt to return the most appropriate base class
     # (and its level identifier)
     def _determine_base_class(self, classes):
-        keys = reversed(self.base_classes.keys())
-        for level_number in keys:
-            level = self.base_classes[level_number]
-            for bc in level:
-                base_class = level[bc]
-                for cls in classes:
-                    if cls in base_class['ies_subclasses']:
-                        return base_class["python_class"], level_number
-
-        return self.base_classes[0]["python_class"], 0
+        best = None
+        for cls in classes:
+            candidate = self._base_class_index.get(cls)
+            if candidate is not None and (best is None or candidate[:2] > best[:2]):
+                best = candidate
+        if best is not None:
+            return best[2], best[0]
+
+        return RdfsResource, 0
+
+    # Maps every IES class URI to the Python class that _determine_base_class should pick for it, as
+    # (level, -position in level, python_class), so the deepest (then first-listed) base class wins
+    def _index_base_classes(self) -> dict:
+        index = {}
+        for level_number in sorted(self.base_classes):
+            for position, base_class in enumerate(self.base_classes[level_number].values()):
+                entry = (level_number, -position, base_class["python_class"])
+                for sub in base_class['ies_subclasses']:
+                    if sub not in index or index[sub][0] < level_number:
+                        index[sub] = entry
+        return index
 
     def _get_instance(self, uri: str) -> RdfsResource | None:
         """
@@ -402,16 +703,14 @@ class IESTool:
             self.plug_in.set_classes(self.ontology.classes)
             self.plug_in.set_properties(self.ontology.properties)
 
-    def _init_shacl(self, shacl_filename: str):
-        """Loads SHACL shapes for validation
-
-        Args:
-            shacl_filename (str): the shacl file to use
-        """
+    # The SHACL shapes take over a second to parse, so they are only loaded when get_rdf() first validates
+    @functools.cached_property
+    def shacl(self) -> Graph:
         logger.info("parsing SHACL rules")
-        self.shacl = Graph()
-        self.shacl.parse(shacl_filename)
+        shacl = Graph()
+        shacl.parse(self._shacl_filename)
         logger.info("SHACL ready")
+        return shacl
 
     def clear_graph(self) -> uuid.UUID:
         """
@@ -422,20 +721,27 @@ class IESTool:
             uuid.UUID: The session uuid.
         """
 
+        if self._triple_buffer:
+            # Anything still held back belongs to the data that is being cleared, so there's no point sending it
+            self._triple_buffer = {}
+            self._buffered_triple_count = 0
         if self.__mode == "plugin":
             self.plug_in.clear_triples()
         elif self.__mode == "sparql_server":
-            self.run_sparql_update("DELETE {?s ?p ?o .} WHERE {?s ?p ?o .}")
+            self.run_sparql_update("CLEAR DEFAULT")
         else:
             if self.graph is not None:
                 del self.graph
             self.graph = Graph()
-            for prefix in self.prefixes:
-                self.graph.bind(prefix.replace(":", ""), self.prefixes[prefix])
+            for prefix, uri in self.prefixes.items():
+                self.graph.bind(prefix.replace(":", ""), uri)
         self.session_uuid = uuid.uuid4()
         self.session_uuid_str = self.session_uuid.hex
+        self._generated_uri_prefix = None
         self.session_instance_count = 0
         self.instances = {}
+        # The last number minted per dependent-URI stem (one per parent URI and postfix), capped at STEM_COUNTER_LIMIT
+        self._stem_counters: dict[str, int] = {}
         return self.session_uuid
 
     def run_sparql_update(self, query: str, security_label: str | None = None):
@@ -446,18 +752,27 @@ class IESTool:
             query (str): The SPARQL query
             security_label (str): Security labels to apply to the data being created (this only applies
             if using Telicent CORE)
+
+        Raises:
+            requests.HTTPError: If the SPARQL server rejects the update
         """
 
+        self.flush()
         if self.__mode == "sparql_server":
             if security_label is None:
                 security_label = self.default_security_label
-            post_uri = f"{self.server_host}{self.server_dataset}/update"
             headers = {
                 'Accept': '*/*',
                 'Security-Label': security_label,
                 'Content-Type': 'application/sparql-update'
             }
-            requests.post(post_uri, headers=headers, data=f"{self.format_prefixes()}{query}")
+            # Sent as UTF-8 bytes - given a str, http.client would encode the body as Latin-1 (and fail on e.g. CJK
+            # names), and encoding it here means the body is built and copied only once
+            # A rejected update would otherwise lose its triples (a whole batch, for add_triples) without any sign
+            response = self._http.post(
+                self._update_uri, headers=headers, data=f"{self.format_prefixes()}{query}".encode()
+            )
+            response.raise_for_status()
         elif self.__mode == "rdflib":
             self.graph.update(f"{self.format_prefixes()}{query}")
         else:
@@ -489,14 +804,17 @@ class IESTool:
             query (str): The query to run
         """
 
+        self.flush()
         if self.__mode == "sparql_server":
-            get_uri = f"{self.server_host}{self.server_dataset}/query"
-            response = requests.get(get_uri, params={'query': f"{self.format_prefixes()}{query}"})
-            return response.json()
+            full_query = f"{self.format_prefixes()}{query}"
+            if len(full_query) <= SPARQL_GET_QUERY_LIMIT:
+                response = self._http.get(self._query_uri, params={'query': full_query})
+            else:
+                response = self._http.post(self._query_uri, data={'query': full_query})
+            return _json_loads(response.content)
         elif self.__mode == "rdflib":
-            self.graph.query(f"{self.format_prefixes()}{query}")
-            with io.StringIO() as f:
-                return json.loads(f.getvalue())
+            result = self.graph.query(_prepared_query(f"{self.format_prefixes()}{query}"))
+            return _json_loads(result.serialize(format="json"))
         else:
 
             raise RuntimeError(
@@ -504,6 +822,24 @@ class IESTool:
 
             )
 
+    def run_sparql_queries(self, queries: Iterable[str], max_workers: int = 8) -> list[dict]:
+        """
+        Runs several independent SPARQL queries, returning their results in the same order. In sparql_server mode
+        the queries are sent concurrently, so the total wait is roughly that of the slowest query rather than the sum.
+
+        Args:
+            queries (Iterable[str]): The queries to run
+            max_workers (int): The most queries to have in flight at once in sparql_server mode
+
+        Returns:
+            list[dict]: The results of each query, as returned by run_sparql_query()
+        """
+        self.flush()
+        if self.__mode != "sparql_server":
+            return [self.run_sparql_query(query) for query in queries]
+        with concurrent.futures.ThreadPoolExecutor(max_workers=min(max_workers, SPARQL_POOL_SIZE)) as executor:
+            return list(executor.map(self.run_sparql_query, queries))
+
     @staticmethod
     def _str(_input: str | Graph) -> str | Graph:
         """
@@ -545,12 +881,8 @@ class IESTool:
         """
 
         if is_literal:
-            o = f'"{obj}"'
-            if literal_type:
-                o = f'{o}^^{literal_type}'
-        else:
-            o = f'<{obj}>'
-        return o
+            return _literal_term(obj, literal_type)
+        return f'<{obj}>'
 
     def _prep_spo(self, subject: str, predicate: str, obj: str, is_literal: bool = True,
                   literal_type: str | None = None) -> str:
@@ -596,13 +928,14 @@ class IESTool:
             "validation_errors": "",
             "warnings": [],
         }
+        self.flush()
         if self.__mode == "sparql_server":
             logger.warning("Export RDF not supported in sparql server mode")
         elif self.__mode == "plugin":
             if rdf_format not in self.plug_in.supported_rdf_serialisations:
                 logger.warning(
-                    f"Current plugin only supports {str(self.plug_in.supported_rdf_serialisations)}"
-                    f" - you tried to export as {rdf_format}"
+                    "Current plugin only supports %s - you tried to export as %s",
+                    self.plug_in.supported_rdf_serialisations, rdf_format
                 )
             ret_dict["triples"] = self.plug_in.get_rdf()
             ret_dict["warnings"].extend(self.plug_in.get_warnings())
@@ -610,6 +943,8 @@ class IESTool:
                 self.clear_graph()
         else:
             if self.__validate:
+                from pyshacl import validate as pyshacl_validate  # only needed when validating, and slow to import
+
                 r = pyshacl_validate(
                     self.graph,
                     shacl_graph=self.shacl,
@@ -644,7 +979,7 @@ class IESTool:
         with open(filename, "w") as text_file:
             ret_dict = self.get_rdf(rdf_format=rdf_format, clear=clear)
             text_file.write(ret_dict["triples"])
-            logger.info(f"File written: {filename}")
+            logger.info("File written: %s", filename)
 
     def in_graph(
             self, subject: str, predicate: str, obj: str, is_literal: bool = False, literal_type: str = "string"
@@ -663,15 +998,17 @@ class IESTool:
             bool: Whether the triple is in the graph of not
         """
 
+        self.flush()
         if self.__mode == "plugin":
             return self.plug_in.in_graph(subject, predicate, obj, is_literal=is_literal)
         elif self.__mode == "sparql_server":
             f'ASK {{ <> <>  {self._prep_object(obj, is_literal, literal_type)}}}'
         else:
             if is_literal:
-                return (URIRef(subject), URIRef(predicate), Literal(obj)) in self.graph
+                o = Literal(obj, datatype=_xsd_datatype(literal_type))
             else:
-                return (URIRef(subject), URIRef(predicate), Literal(obj)) in self.graph
+                o = _uri_ref(obj)
+            return (_uri_ref(subject), _vocab_ref(predicate), o) in self.graph
 
     def generate_data_uri(self, context: str | None = None) -> str:
         """
@@ -680,11 +1017,9 @@ class IESTool:
         Args:
             context (str): an additional string to insert into the URI to provide human-readable context
         """
-        if context is None:
-            context = ""
-        uri = f'{self.default_data_namespace}{self.session_uuid_str}{context}_{self.session_instance_count:06d}'
-        self.session_instance_count = self.session_instance_count + 1
-        return uri
+        count = self.session_instance_count
+        self.session_instance_count = count + 1
+        return f'{self._generated_uri_prefix or self.generated_uri_prefix}{context or ""}_{count:06d}'
 
     def delete_triple(self, subject: str, predicate: str, obj: str, is_literal: bool = False) -> bool:
         """
@@ -710,6 +1045,26 @@ class IESTool:
             self.run_sparql_update(update)
         return True
 
+    def delete_triples(self, triples: list[tuple]) -> bool:
+        """
+        Removes several triples in one DELETE DATA update, rather than one update (and in sparql_server mode, one
+        HTTP request) per triple
+
+        Args:
+            triples (list[tuple]): The triples to remove. Each one is either (subject, predicate, obj) where obj is a
+                URI, or (subject, predicate, obj, is_literal, literal_type)
+
+        Returns:
+            bool: Returns true if the update has executed. This does not guarantee the data was deleted though.
+        """
+
+        if self.__mode == "plugin" and not self.plug_in.deletion_supported:
+            logger.warning("Triple deletion not currently supported in plugin")
+        elif triples:
+            statements = " . ".join(self._prep_spo(*self._expand_triple(triple)) for triple in triples)
+            self.run_sparql_update(f'DELETE DATA {{{statements}}}')
+        return True
+
     def add_to_graph(self, subject: str, predicate: str, obj: str, is_literal: bool = False,
                      literal_type: str = "string", security_label: str | None = None) -> bool:
         """DEPRECATED - use add_triple()
@@ -744,14 +1099,18 @@ class IESTool:
             obj (str): The object of the triple to add
             is_literal (bool): Whether to check a literal or not
             literal_type (str): The type of literal
-            security_label (str): Security label to apply
+            security_label (str): Security label to apply. Defaults to the tool's default_security_label
 
         Returns:
             bool: If the update ran. SPARQL endpoints do not confirm addition though, so check dataset after use
         """
 
         if security_label is None:
-            security_label = ""
+            security_label = self.default_security_label if self.__mode == "sparql_server" else ""
+
+        if self._triple_buffer is not None:
+            self._buffer_triples([(subject, predicate, obj, is_literal, literal_type)], security_label)
+            return True
 
         if self.__mode == "plugin":
             self.plug_in.add_triple(
@@ -759,34 +1118,186 @@ class IESTool:
             )
             return True
         elif self.__mode == "sparql_server":
-            triple = self._prep_spo(subject, predicate, obj, is_literal, literal_type)
-            query = f'INSERT DATA {{{triple}}}'
-            self.run_sparql_update(query=query, security_label=security_label)
-        elif not self.in_graph(
-                subject=subject, predicate=predicate, obj=obj, is_literal=is_literal, literal_type=literal_type
-        ):
-            # See is someone has passed a rdflib type and fix it
-            subject = self._str(subject)
-            predicate = self._str(predicate)
-            obj = self._str(obj)
+            return self.add_triples([(subject, predicate, obj, is_literal, literal_type)], security_label)
+        else:
+            self.graph.add(self._make_rdflib_triple(subject, predicate, obj, is_literal, literal_type))
 
-            # Send out a warning if a non-IES predicate is used
-            if is_literal:
-                if predicate not in self.ontology.datatype_properties:
-                    logger.warning(f"non-IES datatype property used: {predicate}")
-            else:
-                if predicate not in self.ontology.object_properties:
-                    logger.warning(f"non-IES object property used: {predicate}")
+    def add_triples(self, triples: list[tuple], security_label: str | None = None) -> bool:
+        """
+        Adds several triples in one go. This has the same effect as calling add_triple() for each one, but the
+        per-call overhead (and in sparql_server mode, the HTTP request) is only paid once.
 
-            if is_literal:
-                try:
-                    lt = getattr(XSD, literal_type)
-                except AttributeError:
-                    lt = XSD.string
-                obj = Literal(obj, datatype=lt)
-            else:
-                obj = URIRef(obj)
-            self.graph.add((URIRef(subject), URIRef(predicate), obj))
+        Args:
+            triples (list[tuple]): The triples to add. Each one is either (subject, predicate, obj) where obj is a URI,
+                or (subject, predicate, obj, is_literal, literal_type)
+            security_label (str): Security label to apply. Defaults to the tool's default_security_label
+
+        Returns:
+            bool: If the update ran. SPARQL endpoints do not confirm addition though, so check dataset after use
+        """
+
+        if security_label is None:
+            # Resolved once here, so the Graph Store upload and INSERT DATA (including the fallback from one to the
+            # other) always send the same label
+            security_label = self.default_security_label if self.__mode == "sparql_server" else ""
+
+        if self._triple_buffer is not None:
+            self._buffer_triples(triples, security_label)
+            return True
+
+        if self.__mode == "plugin":
+            self.plug_in.add_triples([self._expand_triple(triple) for triple in triples])
+            return True
+        elif self.__mode == "sparql_server":
+            if triples and self._graph_store_upload and self._upload_ntriples(triples, security_label):
+                return True
+            if triples:
+                statements = " . ".join(self._prep_spo(*self._expand_triple(triple)) for triple in triples)
+                self.run_sparql_update(query=f'INSERT DATA {{{statements}}}', security_label=security_label)
+        else:
+            self.graph.addN(
+                (*self._make_rdflib_triple(*self._expand_triple(triple)), self.graph) for triple in triples
+            )
+        return True
+
+    def _upload_ntriples(self, triples: list[tuple], security_label: str) -> bool:
+        """
+        Sends triples to the triplestore's default graph through the SPARQL Graph Store Protocol
+
+        Args:
+            triples (list[tuple]): The triples to send, in any form accepted by add_triples()
+            security_label (str): Security label to apply
+
+        Returns:
+            bool: False if the endpoint didn't accept the upload (the caller should fall back to INSERT DATA)
+        """
+        # The same serialisation as INSERT DATA, so a fallback sends exactly what the upload would have
+        lines = [f"{self._prep_spo(*self._expand_triple(triple))} .\n" for triple in triples]
+        response = self._http.post(
+            self._graph_store_uri,
+            headers={
+                'Security-Label': security_label,
+                'Content-Type': 'application/n-triples'
+            },
+            data="".join(lines).encode()
+        )
+        if response.status_code in (404, 405, 415):
+            logger.warning("Graph Store Protocol upload rejected (HTTP %s) - using INSERT DATA instead",
+                           response.status_code)
+            self._graph_store_upload = False
+            return False
+        if not 200 <= response.status_code < 300:
+            # Any other failure (e.g. a payload the server couldn't parse, or one too large) may be specific to these
+            # triples, so they are retried with INSERT DATA but later uploads still go through the Graph Store
+            logger.warning("Graph Store Protocol upload failed (HTTP %s) - retrying with INSERT DATA",
+                           response.status_code)
+            return False
+        return True
+
+    @contextlib.contextmanager
+    def batch(self, flush_every: int | None = None):
+        """
+        Context manager that holds back every triple added inside it and writes them all in one add_triples() call
+        per security label when the block exits - e.g.
+
+            with tool.batch(flush_every=10000):
+                for row in rows:
+                    Person(tool=tool, given_name=row["given"], surname=row["surname"])
+
+        Triples added inside the block are not added to the graph until they are flushed, which happens when the block
+        exits and before any SPARQL query, update, in_graph() check or get_rdf() export. Nested batch() blocks join
+        the outermost one, as does a batch() block on a tool created with sparql_batch_size. If a flush fails (e.g.
+        the SPARQL server rejects the update) the error is raised where the flush happened, and the triples that were
+        held back are discarded rather than retried.
+
+        Args:
+            flush_every (int | None): Also flush whenever this many triples have been held back - this bounds the
+                memory used (and, in sparql_server mode, the size of each update). Defaults to None (flush on exit).
+        """
+        if self._triple_buffer is not None:
+            yield self
+            return
+        self._triple_buffer = {}
+        self._buffered_triple_count = 0
+        self._batch_flush_every = flush_every
+        try:
+            yield self
+        finally:
+            try:
+                self._flush_triple_buffer()
+            finally:
+                # Always leave batch mode, even if the flush failed - otherwise every later triple would be held back
+                self._triple_buffer = None
+
+    def flush(self):
+        """
+        Writes out any triples being held back by batch() or sparql_batch_size
+        """
+        if self._triple_buffer:
+            self._flush_triple_buffer()
+
+    def _buffer_triples(self, triples: list[tuple], security_label: str):
+        self._triple_buffer.setdefault(security_label, []).extend(triples)
+        self._buffered_triple_count += len(triples)
+        if self._batch_flush_every and self._buffered_triple_count >= self._batch_flush_every:
+            self._flush_triple_buffer()
+
+    def _flush_triple_buffer(self):
+        buffer, self._triple_buffer = self._triple_buffer, None
+        try:
+            for security_label, triples in buffer.items():
+                self.add_triples(triples, security_label=security_label)
+        finally:
+            self._triple_buffer = {}
+            self._buffered_triple_count = 0
+
+    @staticmethod
+    def _expand_triple(triple: tuple) -> tuple:
+        """
+        Pads a (subject, predicate, obj) tuple out to (subject, predicate, obj, is_literal, literal_type)
+
+        Args:
+            triple (tuple): a 3-tuple for object properties or a 5-tuple for literals
+        """
+        if len(triple) == 3:
+            return triple[0], triple[1], triple[2], False, "string"
+        return triple
+
+    def _make_rdflib_triple(self, subject: str, predicate: str, obj: str, is_literal: bool = False,
+                            literal_type: str = "string") -> tuple:
+        """
+        Converts a triple of strings into rdflib terms, ready for adding to the in-memory graph
+
+        Args:
+            subject (str): The subject of the triple
+            predicate (str): The predicate of the triple
+            obj (str): The object of the triple
+            is_literal (bool): Whether the object is a literal
+            literal_type (str): The type of literal
+
+        Returns:
+            tuple: the rdflib triple - the graph is a set, so re-adding an existing triple is harmless
+        """
+        # See is someone has passed a rdflib type and fix it
+        subject = self._str(subject)
+        predicate = self._str(predicate)
+        obj = self._str(obj)
+
+        # Send out a warning if a non-IES predicate is used
+        if is_literal:
+            if predicate not in self.ontology.datatype_properties:
+                logger.warning("non-IES datatype property used: %s", predicate)
+        else:
+            if predicate not in self.ontology.object_properties:
+                logger.warning("non-IES object property used: %s", predicate)
+
+        if is_literal:
+            obj = Literal(obj, datatype=_xsd_datatype(literal_type))
+        elif predicate == RDF_TYPE:
+            obj = _vocab_ref(obj)
+        else:
+            obj = _uri_ref(obj)
+        return _uri_ref(subject), _vocab_ref(predicate), obj
 
     def add_literal_property(self, subject: str, predicate: str, obj: str, literal_type: str = "string") -> bool:
         """
@@ -831,14 +1342,6 @@ class IESTool:
             # Make an uri based on the data stub...
             uri = self.generate_data_uri(instance_uri_context)
 
-        cls_str: str = ""
-        classes.sort()
-
-        # If we have more than one class, we make a new class name by concatenating the class names
-        for cls in classes:
-            cls_name = cls.replace(self.ies_namespace, "")
-            cls_str = f"{cls_str}{cls_name}"
-
         return base_class(uri=uri, tool=self, classes=classes)
 
     def create_event(self, uri: str | None = None, classes: list | None = None,
@@ -859,7 +1362,7 @@ class IESTool:
         warnings.warn("IESTool.create_event is deprecated - please initiate Event Python class directly",
                       DeprecationWarning, stacklevel=2)
         if classes is None:
-            classes = [EVENT]
+            classes = Event._default_classes
 
         return Event(tool=self, start=event_start, end=event_end, uri=uri, classes=classes)
 
@@ -887,7 +1390,7 @@ class IESTool:
                       DeprecationWarning, stacklevel=2)
 
         if classes is None:
-            classes = [PERSON]
+            classes = Person._default_classes
 
         person = Person(
             tool=self, surname=surname, given_name=given_name, start=dob, place_of_birth=pob,
@@ -914,7 +1417,7 @@ class IESTool:
                       DeprecationWarning, stacklevel=2)
 
         if classes is None:
-            classes = [MEASURE]
+            classes = Measure._default_classes
 
         return Measure(tool=self, value=value, uom=uom, uri=uri, classes=classes)
 
@@ -939,7 +1442,7 @@ class IESTool:
         logger.warning("IESTool.create_communication deprecated - please initiate Communication Python class directly")
 
         if classes is None:
-            classes = [COMMUNICATION]
+            classes = Communication._default_classes
 
         communication = Communication(tool=self, uri=uri, classes=classes, start=starts_in, end=ends_in,
                                       message_content=message_content)
@@ -967,15 +1470,78 @@ class IESTool:
                       stacklevel=2)
 
         if classes is None:
-            classes = [GEOPOINT]
+            classes = GeoPoint._default_classes
 
         for _class in classes:
             if _class not in self.ontology.geopoint_subtypes:
-                logger.warning(f"{_class} is not a subtype of ies:GeoPoint")
+                logger.warning("%s is not a subtype of ies:GeoPoint", _class)
         return GeoPoint(
             tool=self, uri=uri, lat=lat, lon=lon, precision=precision, classes=classes
         )
 
+    def add_geopoints(self, coordinates: Iterable[tuple[float, float]], precision: int = 6) -> list[str]:
+        """
+        Bulk-loads GeoPoints, producing the same triples as GeoPoint() but without constructing a Python object per
+        point - all the triples go to the graph in a single add_triples() call. Use this for large ingests of
+        coordinates; use GeoPoint() when the Python objects are needed.
+
+        Args:
+            coordinates (Iterable[tuple[float, float]]): (lat, lon) pairs as decimals
+            precision (int): the precision of the produced geohashes
+
+        Returns:
+            list[str]: the URIs of the GeoPoints, in the same order as the coordinates
+        """
+        uris = []
+        triples = []
+        for lat, lon in coordinates:
+            uri = f"{GEOHASH}{_encode_geohash(float(lat), float(lon), precision)}"
+            uris.append(uri)
+            triples.append((uri, RDF_TYPE, GEOPOINT))
+            for postfix, id_class, value in (("LAT", LATITUDE, lat), ("LON", LONGITUDE, lon)):
+                id_uri = f"{uri}_{postfix}"
+                triples.append((id_uri, RDF_TYPE, id_class))
+                triples.append((id_uri, REPRESENTATION_VALUE, str(value), True, "string"))
+                triples.append((uri, IS_IDENTIFIED_BY, id_uri))
+        self.add_triples(triples)
+        return uris
+
+    def country(self, country_alpha_3_code: str) -> Country:
+        """
+        Returns the Country for an ISO3166 alpha-3 code. Country URIs are derived from the code, so the Country (and
+        its identifier and name triples) is only created the first time a code is seen in the current graph - use
+        this in preference to Country() when the same countries come up again and again.
+
+        Args:
+            country_alpha_3_code (str): ISO3166 alpha3 code
+
+        Returns:
+            Country: the (possibly pre-existing) Country instance
+        """
+        country = self._get_instance(f"{ISO3166}{country_alpha_3_code}")
+        if country is None:
+            country = Country(tool=self, country_alpha_3_code=country_alpha_3_code)
+        return country
+
+    def particular_period(self, time_string: str) -> ParticularPeriod:
+        """
+        Returns the ParticularPeriod for an ISO8601 string. As with country(), the URI is derived from the string, so
+        the period (and its representation triple) is only created the first time a time string is seen - dates tend
+        to recur heavily in time-series data.
+
+        Args:
+            time_string (str): the ISO8601 representation of the period
+
+        Returns:
+            ParticularPeriod: the (possibly pre-existing) ParticularPeriod instance
+        """
+        period = None
+        if time_string:
+            period = self._get_instance(f"{ISO8601}{str(time_string).replace(' ', 'T')}")
+        if period is None:
+            period = ParticularPeriod(tool=self, time_string=time_string)
+        return period
+
     def create_organisation(self, uri: str | None = None, classes: list | None = None,
                             name: str | None = None) -> Organisation:
         """
@@ -993,7 +1559,7 @@ class IESTool:
                       DeprecationWarning, stacklevel=2)
 
         if classes is None:
-            classes = [ORGANISATION]
+            classes = Organisation._default_classes
         return Organisation(
             tool=self, name=name, uri=uri, classes=classes
         )
@@ -1015,29 +1581,46 @@ class Unique(type):
         # classes = kwargs["classes"]
         cache = tool.instances
 
-        if "uri" not in kwargs:
-            uri = tool.generate_data_uri()
-        else:
-            uri = kwargs["uri"]
-            if not uri:
-                uri = tool.generate_data_uri()
-        if not validators.url(uri):
-            logger.error(f"Invalid URI: {uri}")
-        if uri not in cache:
+        # Without a URI, __init__ mints a fresh one (or derives it from its other arguments), so there is nothing
+        # to validate or look up in the cache here
+        uri = kwargs.get("uri")
+        # URIs under this session's generated prefix were minted by the tool (e.g. dependent names and states), so
+        # only caller-supplied URIs need the comparatively expensive URL validation
+        if uri and not uri.startswith(tool.generated_uri_prefix) and not _is_uri(uri):
+            logger.error("Invalid URI: %s", uri)
+        if not uri or uri not in cache:
             self = cls.__new__(cls, args, kwargs)
-            cls.__init__(self, *args, **kwargs)
-            cache[uri] = self
+            try:
+                cls.__init__(self, *args, **kwargs)
+            except Exception:
+                # Don't leave a partially constructed instance registered against its URI
+                instances = self._tool.instances if hasattr(self, "_tool") else cache
+                if hasattr(self, "_uri") and instances.get(self._uri) is self:
+                    del instances[self._uri]
+                raise
             return self
         else:
             cached_item = cache[uri]
             return cached_item
 
 
+class _NoClasses(tuple):
+    __slots__ = ()
+
+
+# Pass as classes= to wrap a node without asserting any rdf:type (e.g. one that is typed elsewhere). An empty list
+# can't be used for this, as like None it means "use the class's default classes"
+NO_CLASSES = _NoClasses()
+
+
 class RdfsResource(metaclass=Unique):
     """
     A Python wrapper class for RDFS Resources
     """
 
+    __slots__ = ("_tool", "_uri", "_dependent_uri_stem", "_classes", "__weakref__")
+    _default_classes = (RDFS_RESOURCE,)
+
     def __init__(
             self, tool: IESTool = IES_TOOL, uri: str | None = None, classes: list[str] | None = None
     ):
@@ -1047,15 +1630,18 @@ class RdfsResource(metaclass=Unique):
             Args:
                 tool (IESTool): The IES Tool which holds the data you're working with
                 uri (str): the URI of the RDFS Resource
-                classes (list): the RDFS classes to instantiate
+                classes (list): the RDFS classes to instantiate. Defaults to the class's default classes if None
+                    or empty - pass NO_CLASSES to assert no rdf:type at all
 
             Returns:
                 RdfsResource:
         """
 
-        if classes is None or classes == []:
-            classes = [RDFS_RESOURCE]
-        elif not isinstance(classes, list):
+        if classes is NO_CLASSES:
+            pass
+        elif not classes:
+            classes = self._default_classes
+        elif not isinstance(classes, (list, tuple)):  # noqa: UP038 - X | Y in isinstance() needs Python 3.10
             raise Exception("classes parameter must be a list")
         if tool is None:
             self._tool = IES_TOOL
@@ -1065,12 +1651,25 @@ class RdfsResource(metaclass=Unique):
             self._uri = self.tool.generate_data_uri()
         else:
             self._uri = uri
+        # Stem shared by all URIs minted for nodes that depend on this one (names, birth states, etc.)
+        self._dependent_uri_stem = f"{self._uri}_"
 
-        for cls in classes:
-            self.tool.add_triple(subject=self._uri, predicate=RDF_TYPE, obj=cls)
+        self.tool.add_triples([(self._uri, RDF_TYPE, cls) for cls in classes])
         self._classes = classes
 
-        self.tool.instances[self._uri] = self
+        # setdefault so that re-running __init__ on an existing URI never replaces the registered instance
+        self.tool.instances.setdefault(self._uri, self)
+
+    def __hash__(self):
+        return hash(self._uri)
+
+    def __eq__(self, other):
+        # Instances are identified by their URI, so they also compare equal to the URI string itself
+        if isinstance(other, RdfsResource):
+            return self._uri == other._uri
+        if isinstance(other, str):
+            return self._uri == other
+        return NotImplemented
 
     @property
     def tool(self):
@@ -1090,6 +1689,17 @@ class RdfsResource(metaclass=Unique):
         return self.tool.make_results_list_from_query(
             "SELECT ?c WHERE {<" + self._uri + "> <http://www.w3.org/2000/01/rdf-schema#comment> ?c }", "c")
 
+    def _mint_dependent_uri(self, postfix: str) -> str:
+        """Mints a unique URI for a node that depends on this one (e.g. a Person's birth state)
+
+        Args:
+            postfix (str): a short tag for the dependent node, e.g. "BIRTH"
+
+        Returns:
+            str: the minted URI
+        """
+        return self.tool._mint_uri_from_stem(f"{self._dependent_uri_stem}{postfix}_")
+
     def add_type(self, class_uri) -> None:
         """Adds a rdf:type predicate from this object to a rdfs:Class referenced by the class_uri
 
@@ -1148,6 +1758,23 @@ class RdfsResource(metaclass=Unique):
         related_object = self._validate_referenced_object(related_object, context="add_relation")
         return self.tool.add_triple(self._uri, predicate=predicate, obj=related_object, is_literal=False)
 
+    def _referenced_uri(self, reference, base_type: Unique | None = None, context: str | None = None) -> str:
+        """
+        Returns the URI of a referenced object. Use this rather than _validate_referenced_object() when only the URI
+        is needed - URI strings are passed straight through without looking up or creating a wrapper object.
+
+        Args:
+            reference (): Either an object (subtype of RdfsResource) or a URI reference to an instance (i.e. a string)
+            base_type (Unique, optional): The base class to infer if the reference is not a string. Defaults to None.
+            context (str, optional): A helper string for debugging output. Defaults to "".
+
+        Returns:
+            str: The URI of the referenced object
+        """
+        if isinstance(reference, str):
+            return reference
+        return self._validate_referenced_object(reference, base_type, context).uri
+
     def _validate_referenced_object(self, reference, base_type: Unique | None = None,
                                     context: str | None = None) -> RdfsResource:
         """
@@ -1166,24 +1793,26 @@ class RdfsResource(metaclass=Unique):
         Returns:
             RdfsResource: The provided or inferred object
         """
-        if context is None:
-            context = ""
-
-        if isinstance(reference, str):
+        # Objects are the common case, so they are checked for first and returned without any further work
+        if isinstance(reference, RdfsResource):
+            return reference
+        elif isinstance(reference, str):
             inst = self.tool._get_instance(reference)
             if inst is not None:
                 return inst
             else:
-                logger.warning(
-                    f'''String passed instead of object in {context}
-                    - assumed URI is defined elsewhere: {reference}
-                    - base class {base_type.__name__} has been inferred'''
-                )
                 if base_type is None:
                     base_type = RdfsResource
-                return base_type(tool=self.tool, uri=reference, classes=[])
-        elif isinstance(reference, RdfsResource):
-            return reference
+                if context is None:
+                    context = ""
+                logger.warning(
+                    '''String passed instead of object in %s
+                    - assumed URI is defined elsewhere: %s
+                    - base class %s has been inferred''',
+                    context, reference, base_type.__name__
+                )
+                # No rdf:type triples are emitted for a node that is typed elsewhere
+                return base_type(tool=self.tool, uri=reference, classes=NO_CLASSES)
         else:
             raise Exception(f"Unknown type {str(type(reference))} in {context}")
 
@@ -1193,6 +1822,9 @@ class RdfsClass(RdfsResource):
         A Python wrapper class for RDFS Class
     """
 
+    __slots__ = ()
+    _default_classes = (RDFS_CLASS,)
+
     def __init__(
             self, tool: IESTool = IES_TOOL, uri: str | None = None, classes: list[str] | None = None
     ):
@@ -1207,8 +1839,6 @@ class RdfsClass(RdfsResource):
             Returns:
                 RdfsClass:
         """
-        if classes is None:
-            classes = [RDFS_CLASS]
         super().__init__(tool=tool, uri=uri, classes=classes)
 
     def instantiate(self, uri=None) -> RdfsResource:
@@ -1239,6 +1869,9 @@ class ExchangedItem(RdfsResource):
         A Python wrapper class for IES ExchangedItem
     """
 
+    __slots__ = ()
+    _default_classes = (EXCHANGED_ITEM,)
+
     def __init__(
             self, tool: IESTool = IES_TOOL, uri: str | None = None, classes: list[str] | None = None):
         """
@@ -1252,8 +1885,6 @@ class ExchangedItem(RdfsResource):
             Returns:
                 ExchangedItem:
         """
-        if classes is None:
-            classes = [EXCHANGED_ITEM]
         super().__init__(tool=tool, uri=uri, classes=classes)
 
     def add_representation(
@@ -1272,7 +1903,7 @@ class ExchangedItem(RdfsResource):
             Representation: _description_
         """
         if not rep_rel_type:
-            rep_rel_type = f"{IES_BASE}isRepresentedAs"
+            rep_rel_type = IS_REPRESENTED_AS
         representation = Representation(
             tool=self.tool, representation_text=representation_text, uri=uri,
             classes=[representation_class], naming_scheme=naming_scheme
@@ -1297,7 +1928,7 @@ class ExchangedItem(RdfsResource):
             Name:
         """
         if name_rel_type is None:
-            name_rel_type = f"{IES_BASE}hasName"
+            name_rel_type = HAS_NAME
 
         if name_class is None:
             name_class = NAME
@@ -1327,7 +1958,7 @@ class ExchangedItem(RdfsResource):
             Identifier:
         """
         if id_rel_type is None:
-            id_rel_type = f"{IES_BASE}isIdentifiedBy"
+            id_rel_type = IS_IDENTIFIED_BY
 
         if id_class is None:
             id_class = IDENTIFIER
@@ -1344,6 +1975,9 @@ class Element(ExchangedItem):
         A Python wrapper class for IES Element
     """
 
+    __slots__ = ("_default_state_type",)
+    _default_classes = (ELEMENT,)
+
     def __init__(self, tool: IESTool = IES_TOOL, uri: str | None = None, classes: list[str] | None = None,
                  start: str | None = None, end: str | None = None):
         """
@@ -1358,9 +1992,6 @@ class Element(ExchangedItem):
             Returns:
                 Element:
         """
-        if classes is None:
-            classes = [ELEMENT]
-
         super().__init__(tool=tool, uri=uri, classes=classes)
         self._default_state_type = STATE
 
@@ -1381,7 +2012,7 @@ class Element(ExchangedItem):
         """
         part_object = self._validate_referenced_object(part, Element, "add_part")
         if part_rel_type is None:
-            part_rel_type = f"{IES_BASE}isPartOf"
+            part_rel_type = IS_PART_OF
         self.tool.add_triple(part_object.uri, part_rel_type, self._uri)
         return part_object
 
@@ -1410,7 +2041,7 @@ class Element(ExchangedItem):
         state = State(tool=self.tool, start=start, end=end, uri=uri, classes=[state_type])
 
         if not state_rel:
-            state_rel = f"{IES_BASE}isStateOf"
+            state_rel = IS_STATE_OF
 
         self.tool.add_triple(subject=state._uri, predicate=state_rel, obj=self._uri)
 
@@ -1441,7 +2072,7 @@ class Element(ExchangedItem):
         """
         location_object = self._validate_referenced_object(location, Location, "in_location")
         self.tool.add_triple(
-            subject=self.uri, predicate=f"{IES_BASE}inLocation",
+            subject=self.uri, predicate=IN_LOCATION,
             obj=location_object.uri)
         return location_object
 
@@ -1456,8 +2087,8 @@ class Element(ExchangedItem):
         Returns:
             ParticularPeriod:
         """
-        pp_instance = ParticularPeriod(tool=self.tool, time_string=time_string)
-        self.tool.add_triple(self._uri, f"{IES_BASE}inPeriod", pp_instance._uri)
+        pp_instance = self.tool.particular_period(time_string)
+        self.tool.add_triple(self._uri, IN_PERIOD, pp_instance._uri)
         return pp_instance
 
     @validate_datetime_string
@@ -1476,10 +2107,10 @@ class Element(ExchangedItem):
         """
 
         if bounding_state_class is None:
-            bounding_state_class = f"{IES_BASE}BoundingState"
+            bounding_state_class = BOUNDING_STATE
 
         bs = BoundingState(tool=self.tool, classes=[bounding_state_class], uri=uri)
-        self.tool.add_triple(subject=bs._uri, predicate=f"{IES_BASE}isStartOf",
+        self.tool.add_triple(subject=bs._uri, predicate=IS_START_OF,
                              obj=self._uri)
         if time_string:
             bs.put_in_period(time_string=time_string)
@@ -1502,7 +2133,7 @@ class Element(ExchangedItem):
             bounding_state_class = BOUNDING_STATE
 
         bs = BoundingState(tool=self.tool, classes=[bounding_state_class], uri=uri)
-        self.tool.add_triple(subject=bs._uri, predicate=f"{IES_BASE}isEndOf",
+        self.tool.add_triple(subject=bs._uri, predicate=IS_END_OF,
                              obj=self._uri)
         if time_string:
             bs.put_in_period(time_string=time_string)
@@ -1522,7 +2153,7 @@ class Element(ExchangedItem):
             tool=self.tool, uri=uri, classes=[measure_class], value=value, uom=uom
         )
         self.tool.add_triple(
-            subject=self._uri, predicate=f"{IES_BASE}hasCharacteristic", obj=measure._uri
+            subject=self._uri, predicate=HAS_CHARACTERISTIC, obj=measure._uri
         )
 
 
@@ -1531,6 +2162,9 @@ class Entity(Element):
         A Python wrapper class for IES Entity
     """
 
+    __slots__ = ()
+    _default_classes = (ENTITY,)
+
     def __init__(self, tool: IESTool = IES_TOOL, uri: str | None = None, classes: list[str] | None = None,
                  start: str | None = None, end: str | None = None):
         """
@@ -1545,8 +2179,6 @@ class Entity(Element):
             Returns:
                 Entity:
         """
-        if classes is None:
-            classes = [ENTITY]
         super().__init__(
             tool=tool, uri=uri, classes=classes, start=start, end=end
         )
@@ -1557,6 +2189,9 @@ class State(Element):
         A Python wrapper class for IES State
     """
 
+    __slots__ = ()
+    _default_classes = (STATE,)
+
     def __init__(self, tool: IESTool = IES_TOOL, uri: str | None = None, classes: list[str] | None = None,
                  start: str | None = None, end: str | None = None):
         """
@@ -1571,8 +2206,6 @@ class State(Element):
             Returns:
                 State:
         """
-        if classes is None:
-            classes = [STATE]
         super().__init__(
             tool=tool, uri=uri, classes=classes, start=start, end=end
         )
@@ -1583,6 +2216,9 @@ class DeviceState(State):
         A Python wrapper class for IES DeviceState
     """
 
+    __slots__ = ()
+    _default_classes = (DEVICE_STATE,)
+
     def __init__(self, tool: IESTool = IES_TOOL, uri: str | None = None, classes: list[str] | None = None,
                  start: str | None = None, end: str | None = None):
         """
@@ -1598,8 +2234,6 @@ class DeviceState(State):
             Returns:
                 DeviceState:
         """
-        if classes is None:
-            classes = [DEVICE_STATE]
         super().__init__(
             tool=tool, uri=uri, classes=classes, start=start, end=end
         )
@@ -1614,9 +2248,9 @@ class DeviceState(State):
             Identifier:
         """
         if not len(imsi.replace("IMSI", "")) not in (14, 15):
-            logger.warning(f"IMSI: {imsi} does not appear to be valid")
-        uri = f"{self.tool.prefixes['IMSI:']}{imsi.replace(' ', '').replace('IMSI:', '')}"
-        return self.add_identifier(imsi, id_class=f'{IES_BASE}IMSI', uri=uri)
+            logger.warning("IMSI: %s does not appear to be valid", imsi)
+        uri = f"{self.tool.imsi_namespace}{imsi.replace(' ', '').replace('IMSI:', '')}"
+        return self.add_identifier(imsi, id_class=IMSI, uri=uri)
 
     def add_mac_address(self, mac_address: str) -> Identifier:
         """
@@ -1628,9 +2262,9 @@ class DeviceState(State):
             Identifier:
         """
         if not validators.mac_address(mac_address):
-            logger.warning(f"MAC address {mac_address} does not appear to be valid")
-        uri = self.tool.prefixes["ieee802:"] + mac_address.replace(" ", "").replace(":", "")
-        return self.add_identifier(mac_address, id_class=f'{IES_BASE}MACAddress', uri=uri)
+            logger.warning("MAC address %s does not appear to be valid", mac_address)
+        uri = self.tool.ieee802_namespace + mac_address.replace(" ", "").replace(":", "")
+        return self.add_identifier(mac_address, id_class=MAC_ADDRESS, uri=uri)
 
     def add_ip_address(self, ip_address: str) -> Identifier:
         """
@@ -1643,11 +2277,11 @@ class DeviceState(State):
             Identifier:
         """
         if validators.ipv4(ip_address):
-            cls = f"{IES_BASE}IPv4Address"
+            cls = IPV4_ADDRESS
         elif validators.ipv6(ip_address):
-            cls = f"{IES_BASE}IPv6Address"
+            cls = IPV6_ADDRESS
         else:
-            cls = f"{IES_BASE}IPAddress"
+            cls = IP_ADDRESS
         return self.add_identifier(ip_address, id_class=cls)
 
     def add_callsign(self, callsign: str) -> Identifier:
@@ -1660,7 +2294,7 @@ class DeviceState(State):
         Returns:
             Identifier:
         """
-        return self.add_identifier(callsign, id_class=f'{IES_BASE}Callsign')
+        return self.add_identifier(callsign, id_class=CALLSIGN)
 
 
 class Asset(Entity):
@@ -1668,6 +2302,9 @@ class Asset(Entity):
         A Python wrapper class for IES Asset
     """
 
+    __slots__ = ()
+    _default_classes = (ASSET,)
+
     def __init__(self, tool: IESTool = IES_TOOL, uri: str | None = None, classes: list[str] | None = None,
                  start: str | None = None, end: str | None = None):
         """
@@ -1683,8 +2320,6 @@ class Asset(Entity):
             Returns:
                 Device:
         """
-        if classes is None:
-            classes = [ASSET]
         super().__init__(tool=tool, uri=uri, classes=classes, start=start, end=end)
 
         self._default_state_type = ASSET_STATE
@@ -1695,6 +2330,9 @@ class AmountOfMoney(Asset):
         A Python wrapper class for IES AmountOfMoney
     """
 
+    __slots__ = ()
+    _default_classes = (AMOUNT_OF_MONEY,)
+
     def __init__(self, /, tool: IESTool = IES_TOOL, *, amount: float, iso_4217_currency_code_alpha3: str,
                  uri: str | None = None, classes: list[str] | None = None):
         """
@@ -1708,27 +2346,27 @@ class AmountOfMoney(Asset):
             Returns:
                 AmountOfMoney:
         """
-        if classes is None:
-            classes = [AMOUNT_OF_MONEY]
-
         super().__init__(tool=tool, uri=uri, classes=classes)
 
+        import iso4217parse  # imported on first use, as it loads pkg_resources (around 65ms)
+
         currency = iso4217parse.by_alpha3(iso_4217_currency_code_alpha3)
         if currency is None:
-            logger.error(f"Unrecognised ISO4217 alpha3 currency code {iso_4217_currency_code_alpha3}")
+            logger.error("Unrecognised ISO4217 alpha3 currency code %s", iso_4217_currency_code_alpha3)
 
-        currency_uri = self.tool.prefixes["iso4217:"] + iso_4217_currency_code_alpha3
+        currency_uri = self.tool.iso4217_namespace + iso_4217_currency_code_alpha3
 
         currency_object = self.tool._get_instance(currency_uri)
         if currency_object is None:
-            currency_object = ClassOfElement(tool=self.tool, uri=currency_uri, classes=[IES_BASE + "Currency"])
+            currency_object = ClassOfElement(tool=self.tool, uri=currency_uri, classes=[CURRENCY])
             currency_object.add_identifier(iso_4217_currency_code_alpha3)
             if currency:
                 currency_object.add_name(currency.name)
 
-        self.tool.add_triple(self.uri, f"{IES_BASE}currencyDenomination", currency_uri)
-        self.tool.add_triple(self.uri, f"{IES_BASE}currencyAmount", str(amount),
-                             is_literal=True, literal_type="decimal")
+        self.tool.add_triples([
+            (self.uri, CURRENCY_DENOMINATION, currency_uri),
+            (self.uri, CURRENCY_AMOUNT, str(amount), True, "decimal")
+        ])
 
         self._default_state_type = ASSET_STATE
 
@@ -1738,6 +2376,9 @@ class Device(Asset, DeviceState):
         A Python wrapper class for IES Device
     """
 
+    __slots__ = ()
+    _default_classes = (DEVICE,)
+
     def __init__(self, tool: IESTool = IES_TOOL, uri: str | None = None, classes: list[str] | None = None,
                  start: str | None = None, end: str | None = None):
         """
@@ -1753,8 +2394,6 @@ class Device(Asset, DeviceState):
             Returns:
                 Device:
         """
-        if classes is None:
-            classes = [DEVICE]
         super().__init__(tool=tool, uri=uri, classes=classes, start=start, end=end)
 
         self._default_state_type = DEVICE_STATE
@@ -1765,6 +2404,9 @@ class Account(Entity):
         A Python wrapper class for IES Account
     """
 
+    __slots__ = ()
+    _default_classes = (ACCOUNT,)
+
     def __init__(self, tool: IESTool = IES_TOOL, uri: str | None = None, classes: list[str] | None = None,
                  start: str | None = None, end: str | None = None):
         """
@@ -1780,8 +2422,6 @@ class Account(Entity):
             Returns:
                 Account:
         """
-        if classes is None:
-            classes = [ACCOUNT]
         super().__init__(tool=tool, uri=uri, classes=classes, start=start, end=end)
 
         self._default_state_type = ACCOUNT_STATE
@@ -1796,8 +2436,7 @@ class Account(Entity):
         Returns:
             Identifier:
         """
-        id_uri_acc_no = self.tool._mint_dependent_uri(self.uri, "ACC_NO")
-        return self.add_identifier(identifier=account_number, uri=id_uri_acc_no, id_class=f"{IES_BASE}AccountNumber")
+        return self.add_identifier(account_number, id_class=ACCOUNT_NUMBER, uri=self._mint_dependent_uri("ACC_NO"))
 
     def add_account_holder(self, holder, start: str | None = None, end: str | None = None,
                            state_uri: str | None = None) -> State:
@@ -1828,8 +2467,8 @@ class Account(Entity):
             Returns:
                 bool:
         """
-        provider_object = self._validate_referenced_object(provider, ResponsibleActor, "add_account_provider")
-        return self.tool.add_triple(provider_object.uri, PROVIDES_ACCOUNT, self.uri)
+        provider_uri = self._referenced_uri(provider, ResponsibleActor, "add_account_provider")
+        return self.tool.add_triple(provider_uri, PROVIDES_ACCOUNT, self.uri)
 
     def add_registered_telephone_number(self, telephone_number: str, start: str | None = None,
                                         end: str | None = None) -> Identifier:
@@ -1844,18 +2483,25 @@ class Account(Entity):
         Returns:
             Identifier:
         """
-        try:
-            tel = phonenumbers.parse(telephone_number, None)
-            normalised = phonenumbers.format_number(tel, phonenumbers.PhoneNumberFormat.E164)
-            ph_uri = self.tool.prefixes["e164:"] + normalised.replace("+", "")
-        except Exception as e:
-            logger.warning(f"telephone number: {telephone_number} could not be parsed {str(e)}")
-            normalised = telephone_number
-            ph_uri = None
-        state_uri = self.tool._mint_dependent_uri(self.uri, "REG_PHONE")
+        normalised = telephone_number
+        ph_uri = None
+        # With no default region, phonenumbers can only parse numbers that carry an international "+" (or the
+        # full-width "＋"), so don't bother trying with anything else
+        if "+" not in telephone_number and "\uff0b" not in telephone_number:
+            logger.warning("telephone number: %s could not be parsed - no international dialling code",
+                           telephone_number)
+        else:
+            try:
+                normalised = _e164(telephone_number)
+                # E.164 numbers only ever have a single, leading "+"
+                ph_uri = self.tool.e164_namespace + (normalised[1:] if normalised[:1] == "+" else normalised)
+            except Exception as e:
+                logger.warning("telephone number: %s could not be parsed %s", telephone_number, e)
+                normalised = telephone_number
+        state_uri = self._mint_dependent_uri("REG_PHONE")
         state = self.create_state(uri=state_uri, start=start, end=end)
-        tel_no = Identifier(self.tool, id_text=normalised, uri=ph_uri, classes=[f"{IES_BASE}TelephoneNumber"])
-        self.tool.add_triple(subject=state.uri, predicate=f"{IES_BASE}hasRegisteredCommsID", obj=tel_no.uri)
+        tel_no = Identifier(self.tool, id_text=normalised, uri=ph_uri, classes=[TELEPHONE_NUMBER])
+        self.tool.add_triple(subject=state.uri, predicate=HAS_REGISTERED_COMMS_ID, obj=tel_no.uri)
         return tel_no
 
     def add_registered_email_address(self, email_address: str, start: str | None = None,
@@ -1871,16 +2517,16 @@ class Account(Entity):
         Returns:
             Identifier:
         """
-        if validators.email(email_address):
-            em_uri = self.tool.prefixes["rfc5322:"] + email_address
+        if EMAIL_ADDRESS_PATTERN.fullmatch(email_address):
+            em_uri = self.tool.rfc5322_namespace + email_address
         else:
-            logger.warning(f"email address: {email_address} could not be validated")
+            logger.warning("email address: %s could not be validated", email_address)
             em_uri = None
 
-        state_uri = self.tool._mint_dependent_uri(self.uri, "REG_EMAIL")
+        state_uri = self._mint_dependent_uri("REG_EMAIL")
         state = self.create_state(uri=state_uri, start=start, end=end)
-        email_obj = Identifier(self.tool, id_text=email_address, uri=em_uri, classes=[f"{IES_BASE}EmailAddress"])
-        self.tool.add_triple(subject=state.uri, predicate=f"{IES_BASE}hasRegisteredCommsID", obj=email_obj.uri)
+        email_obj = Identifier(self.tool, id_text=email_address, uri=em_uri, classes=[EMAIL_ADDRESS])
+        self.tool.add_triple(subject=state.uri, predicate=HAS_REGISTERED_COMMS_ID, obj=email_obj.uri)
         return email_obj
 
 
@@ -1889,6 +2535,9 @@ class CommunicationsAccount(Account):
         A Python wrapper class for IES Account
     """
 
+    __slots__ = ()
+    _default_classes = (COMMUNICATIONS_ACCOUNT,)
+
     def __init__(self, tool: IESTool = IES_TOOL, uri: str | None = None, classes: list[str] | None = None,
                  start: str | None = None, end: str | None = None):
         """
@@ -1904,8 +2553,6 @@ class CommunicationsAccount(Account):
             Returns:
                 CommunicationsAccount:
         """
-        if classes is None:
-            classes = [COMMUNICATIONS_ACCOUNT]
         super().__init__(tool=tool, uri=uri, classes=classes, start=start, end=end)
 
         self._default_state_type = COMMUNICATIONS_ACCOUNT_STATE
@@ -1916,6 +2563,9 @@ class Location(Entity):
         A Python wrapper class for IES Location
     """
 
+    __slots__ = ()
+    _default_classes = (LOCATION,)
+
     def __init__(self, tool: IESTool = IES_TOOL, uri: str | None = None, classes: list[str] | None = None,
                  start: str | None = None, end: str | None = None):
         """
@@ -1931,8 +2581,6 @@ class Location(Entity):
             Returns:
                 Location:
         """
-        if classes is None:
-            classes = [LOCATION]
         super().__init__(tool=tool, uri=uri, classes=classes, start=start, end=end)
 
         self._default_state_type = LOCATION_STATE
@@ -1943,6 +2591,9 @@ class Country(Location):
     Python wrapper class for IES Country, where ISO country code forms the URI
     """
 
+    __slots__ = ()
+    _default_classes = (COUNTRY,)
+
     def __init__(self, /,tool: IESTool = IES_TOOL, *,country_alpha_3_code: str, country_name: str = None,
                  classes: list[str] | None = None, uri: str = None, validate: bool = True):
         """
@@ -1955,28 +2606,22 @@ class Country(Location):
                 Country:
         """
 
-        uri = f"http://iso.org/iso3166#{country_alpha_3_code}"
-
-        if not classes:
-            classes = [COUNTRY]
+        uri = f"{ISO3166}{country_alpha_3_code}"
 
         super().__init__(tool=tool, uri=uri, classes=classes)
 
         if validate:
-            try:
-                pycountry_obj = pycountry.countries.get(alpha_3=country_alpha_3_code)
-                if pycountry_obj is None:
-                    logger.error(f"country code: {country_alpha_3_code} could not be validated")
-                if country_name:
-                    if country_name != pycountry_obj.name:
-                        logger.warning(f"Country name '{country_name}' doesn't match '{pycountry_obj.name}'")
-                        self.add_country_name(pycountry_obj.name)
-                else:
-                    country_name = pycountry_obj.name
-            except Exception as e:
-                logger.error(f"country code: {country_alpha_3_code} could not be validated {str(e)}")
+            official_name = _country_names_by_alpha_3().get(country_alpha_3_code)
+            if official_name is None:
+                logger.error("country code: %s could not be validated", country_alpha_3_code)
+            elif country_name:
+                if country_name != official_name:
+                    logger.warning("Country name '%s' doesn't match '%s'", country_name, official_name)
+                    self.add_country_name(official_name)
+            else:
+                country_name = official_name
 
-        self.add_identifier(country_alpha_3_code, id_class=IES_BASE + "ISO3166_1Alpha_3", uri=uri + "_ISO3166_1Alpha_3")
+        self.add_identifier(country_alpha_3_code, id_class=ISO3166_1_ALPHA_3, uri=uri + "_ISO3166_1Alpha_3")
         if country_name:
             self.add_country_name(country_name)
 
@@ -1990,8 +2635,8 @@ class Country(Location):
         Returns:
             Name:
         """
-        name_uri = self.tool._mint_dependent_uri(self.uri, "NAME")
-        return self.add_name(name, name_class=IES_BASE + "PlaceName", uri=name_uri)
+        name_uri = self._mint_dependent_uri("NAME")
+        return self.add_name(name, name_class=PLACE_NAME, uri=name_uri)
 
 
 class GeoPoint(Location):
@@ -1999,6 +2644,9 @@ class GeoPoint(Location):
     Python wrapper class for IES GeoPoint, with geo-hashes used to make the URI
     """
 
+    __slots__ = ()
+    _default_classes = (GEOPOINT,)
+
     def __init__(self, tool: IESTool = IES_TOOL, classes: list[str] | None = None,
                  lat: float = None, lon: float = None, precision: int = None):
         """
@@ -2015,20 +2663,11 @@ class GeoPoint(Location):
             Returns:
                 GeoPoint:
         """
-        if classes is None:
-            classes = [GEOPOINT]
-
-        uri = "http://geohash.org/" + str(encode(float(lat), float(lon), precision=precision))
+        uri = f"{GEOHASH}{_encode_geohash(float(lat), float(lon), precision)}"
         super().__init__(tool=tool, uri=uri, classes=classes)
 
-        lat_uri = f"{uri}_LAT"
-        lon_uri = f"{uri}_LON"
-
-        self.add_identifier(identifier=str(lat), uri=lat_uri,
-                            id_class=f"{IES_BASE}Latitude")
-
-        self.add_identifier(identifier=str(lon), uri=lon_uri,
-                            id_class=f"{IES_BASE}Longitude")
+        self.add_identifier(identifier=str(lat), uri=f"{self._dependent_uri_stem}LAT", id_class=LATITUDE)
+        self.add_identifier(identifier=str(lon), uri=f"{self._dependent_uri_stem}LON", id_class=LONGITUDE)
 
 
 class ResponsibleActor(Entity):
@@ -2036,6 +2675,9 @@ class ResponsibleActor(Entity):
     Python wrapper class for IES ResponsibleActor
     """
 
+    __slots__ = ()
+    _default_classes = (RESPONSIBLE_ACTOR,)
+
     def __init__(self, tool: IESTool = IES_TOOL, uri: str | None = None, classes: list[str] | None = None,
                  start: str | None = None, end: str | None = None):
         """
@@ -2051,11 +2693,31 @@ class ResponsibleActor(Entity):
             Returns:
                 ResponsibleActor:
         """
-        if classes is None:
-            classes = [RESPONSIBLE_ACTOR]
         super().__init__(tool=tool, uri=uri, classes=classes, start=start, end=end)
 
-        self._default_state_type = f"{IES_BASE}ResponsibleActorState"
+        self._default_state_type = RESPONSIBLE_ACTOR_STATE
+
+    def _relate_via_state(self, related_item: RdfsResource | str, base_type: Unique, context: str, predicate: str,
+                          start: str | None = None, end: str | None = None) -> State:
+        """
+        Creates a new state of the ResponsibleActor and relates that state to another item - the pattern shared by
+        works_for(), has_access_to(), in_possession_of(), user_of() and owns()
+
+        Args:
+            related_item (RdfsResource | str): The item (or reference to) that the state is related to
+            base_type (Unique): The base class to infer if a URI string is passed as the related_item
+            context (str): The calling method, for debugging output
+            predicate (str): The relationship from the state to the related item
+            start (str | None, optional): The start of the state - ISO8601 string. Defaults to None.
+            end (str | None, optional): The end of the state - ISO8601 string. Defaults to None.
+
+        Returns:
+            State:
+        """
+        related_uri = self._referenced_uri(related_item, base_type, context)
+        state = self.create_state(start=start, end=end)
+        self.tool.add_triple(state._uri, predicate, related_uri)
+        return state
 
     def works_for(self, employer: ResponsibleActor | str, start: str | None = None, end: str | None = None) -> State:
         """
@@ -2069,11 +2731,7 @@ class ResponsibleActor(Entity):
         Returns:
             State:
         """
-        employer_object = self._validate_referenced_object(employer, ResponsibleActor, "works_for")
-        state = self.create_state(start=start, end=end)
-        self.tool.add_triple(subject=state._uri, predicate=f"{IES_BASE}worksFor",
-                             obj=employer_object._uri)
-        return state
+        return self._relate_via_state(employer, ResponsibleActor, "works_for", WORKS_FOR, start, end)
 
     def in_post(self, post: Post | str, start: str | None = None, end: str | None = None) -> State:
         """
@@ -2088,7 +2746,7 @@ class ResponsibleActor(Entity):
             Post:
         """
         post_object = self._validate_referenced_object(post, Post, "in_post")
-        in_post = self.create_state(state_type=f"{IES_BASE}InPost", start=start, end=end)
+        in_post = self.create_state(state_type=IN_POST, start=start, end=end)
         post_object.add_part(in_post)
         return in_post
 
@@ -2104,10 +2762,7 @@ class ResponsibleActor(Entity):
         Returns:
             State:
         """
-        accessed_object = self._validate_referenced_object(accessed_item, Entity, "has_access_to")
-        access = self.create_state(start=start, end=end)
-        self.tool.add_triple(access.uri, f"{IES_BASE}hasAccessTo", accessed_object.uri)
-        return access
+        return self._relate_via_state(accessed_item, Entity, "has_access_to", HAS_ACCESS_TO, start, end)
 
     def in_possession_of(self, accessed_item: Entity | str, start: str | None = None, end: str | None = None) -> State:
         """
@@ -2121,10 +2776,7 @@ class ResponsibleActor(Entity):
         Returns:
             State: _description_
         """
-        accessed_object = self._validate_referenced_object(accessed_item, Entity, "in_possession_of")
-        access = self.create_state(start=start, end=end)
-        self.tool.add_triple(access.uri, f"{IES_BASE}inPossessionOf", accessed_object.uri)
-        return access
+        return self._relate_via_state(accessed_item, Entity, "in_possession_of", IN_POSSESSION_OF, start, end)
 
     def user_of(self, accessed_item: Entity | str, start: str | None = None, end: str | None = None) -> State:
         """
@@ -2138,10 +2790,7 @@ class ResponsibleActor(Entity):
         Returns:
             State:
         """
-        accessed_object = self._validate_referenced_object(accessed_item, Entity, "user_of")
-        access = self.create_state(start=start, end=end)
-        self.tool.add_triple(access.uri, f"{IES_BASE}userOf", accessed_object.uri)
-        return access
+        return self._relate_via_state(accessed_item, Entity, "user_of", USER_OF, start, end)
 
     def owns(self, owned_item: Entity | str, start: str | None = None, end: str | None = None) -> State:
         """
@@ -2155,10 +2804,7 @@ class ResponsibleActor(Entity):
         Returns:
             State:
         """
-        owned_object = self._validate_referenced_object(owned_item, Asset, "owns")
-        owned = self.create_state(start=start, end=end)
-        self.tool.add_triple(owned.uri, f"{IES_BASE}owns", owned_object.uri)
-        return owned
+        return self._relate_via_state(owned_item, Asset, "owns", OWNS, start, end)
 
 
 class Post(ResponsibleActor):
@@ -2166,6 +2812,9 @@ class Post(ResponsibleActor):
     Python wrapper class for IES Post
     """
 
+    __slots__ = ()
+    _default_classes = (POST,)
+
     def __init__(self, tool: IESTool = IES_TOOL, uri: str | None = None, classes: list[str] | None = None,
                  start: str | None = None, end: str | None = None):
         """
@@ -2181,8 +2830,6 @@ class Post(ResponsibleActor):
             Returns:
                 Post:
         """
-        if classes is None:
-            classes = [POST]
         super().__init__(tool=tool, uri=uri, classes=classes, start=start, end=end)
 
         if start is not None:
@@ -2196,6 +2843,9 @@ class Person(ResponsibleActor):
     Python wrapper class for IES Person
     """
 
+    __slots__ = ()
+    _default_classes = (PERSON,)
+
     def __init__(self, tool: IESTool = IES_TOOL, uri: str | None = None, classes: list[str] | None = None,
                  start: str | None = None, end: str | None = None, surname: str | None = None,
                  given_name: str | None = None, date_of_birth: str | None = None, date_of_death: str | None = None,
@@ -2219,34 +2869,31 @@ class Person(ResponsibleActor):
             Returns:
                 Person:
         """
-        if classes is None:
-            classes = [PERSON]
-
-        super().__init__(tool=tool, uri=uri, classes=classes, start=None, end=None)
-
+        # Normalise the aliased arguments before anything is written, so a bad combination leaves no triples behind
         if date_of_birth is not None:
             if start is not None:
                 raise Exception("start and date_of_birth cannot both be set for Person")
             start = date_of_birth
-
         if date_of_death is not None:
             if end is not None:
                 raise Exception("end and date_of_death cannot both be set for Person")
             end = date_of_death
+        if family_name:
+            if surname:
+                logger.error("family_name parameter is deprecated equivalent of surname - do not set both")
+            else:
+                logger.warning("family_name parameter is deprecated - please use surname")
+                surname = family_name
+
+        super().__init__(tool=tool, uri=uri, classes=classes, start=None, end=None)
 
-        self._default_state_type = f"{IES_BASE}PersonState"
+        self._default_state_type = PERSON_STATE
 
         if given_name:
             self.add_given_name(given_name=given_name)
 
         if surname:
             self.add_surname(surname=surname)
-            if family_name:
-                logger.error("family_name parameter is deprecated equivalent of surname - do not set both")
-        else:
-            if family_name:
-                self.add_surname(surname=surname)
-                logger.warning("family_name parameter is deprecated - please use surname")
 
         if start is not None:
             self.add_birth(start, place_of_birth)
@@ -2264,9 +2911,7 @@ class Person(ResponsibleActor):
         Returns:
             Name:
         """
-        name_uri_firstname = self.tool._mint_dependent_uri(self.uri, "GIVENNAME")
-        return self.add_name(given_name, uri=name_uri_firstname,
-                             name_class=f"{IES_BASE}GivenName")
+        return self.add_name(given_name, name_class=GIVEN_NAME, uri=self._mint_dependent_uri("GIVENNAME"))
 
     def add_surname(self, surname: str) -> Name:
         """
@@ -2278,9 +2923,7 @@ class Person(ResponsibleActor):
         Returns:
             Name:
         """
-        name_uri_surname = self.tool._mint_dependent_uri(self.uri, "SURNAME")
-        return self.add_name(surname, uri=name_uri_surname,
-                             name_class=f"{IES_BASE}Surname")
+        return self.add_name(surname, name_class=SURNAME, uri=self._mint_dependent_uri("SURNAME"))
 
     def add_birth(self, date_of_birth: str, place_of_birth: Location | str = None) -> BoundingState:
         """
@@ -2293,12 +2936,11 @@ class Person(ResponsibleActor):
         Returns:
             BoundingState:
         """
-        birth_uri = self.tool._mint_dependent_uri(self.uri, "BIRTH")
-        birth = self.starts_in(time_string=date_of_birth, bounding_state_class=f"{IES_BASE}BirthState",
+        birth_uri = self._mint_dependent_uri("BIRTH")
+        birth = self.starts_in(time_string=date_of_birth, bounding_state_class=BIRTH_STATE,
                                uri=birth_uri)
         if place_of_birth:
-            pob_object = self._validate_referenced_object(place_of_birth, Location, "add_birth")
-            self.tool.add_triple(birth._uri, f"{IES_BASE}inLocation", pob_object._uri)
+            self.tool.add_triple(birth._uri, IN_LOCATION, self._referenced_uri(place_of_birth, Location, "add_birth"))
         return birth
 
     def add_death(self, date_of_death: str, place_of_death: Location | str = None) -> BoundingState:
@@ -2313,13 +2955,12 @@ class Person(ResponsibleActor):
             BoundingState:
         """
 
-        uri = self.tool._mint_dependent_uri(self.uri, "DEATH")
+        uri = self._mint_dependent_uri("DEATH")
         death = self.ends_in(
-            date_of_death, bounding_state_class=f"{IES_BASE}DeathState", uri=uri
+            date_of_death, bounding_state_class=DEATH_STATE, uri=uri
         )
         if place_of_death:
-            pod_object = self._validate_referenced_object(place_of_death, Location, "add_death")
-            self.tool.add_triple(death._uri, f"{IES_BASE}inLocation", pod_object._uri)
+            self.tool.add_triple(death._uri, IN_LOCATION, self._referenced_uri(place_of_death, Location, "add_death"))
 
         return death
 
@@ -2329,6 +2970,9 @@ class Organisation(ResponsibleActor):
     Python wrapper class for IES Organisation
     """
 
+    __slots__ = ()
+    _default_classes = (ORGANISATION,)
+
     def __init__(self, tool: IESTool = IES_TOOL, uri: str | None = None, classes: list | None = None,
                  start: str | None = None, end: str | None = None, name=None):
         """
@@ -2344,11 +2988,9 @@ class Organisation(ResponsibleActor):
             Returns:
                 Organisation:
         """
-        if classes is None:
-            classes = [ORGANISATION]
         super().__init__(tool=tool, uri=uri, classes=classes, start=start, end=end)
 
-        self._default_state_type = f"{IES_BASE}OrganisationState"
+        self._default_state_type = ORGANISATION_STATE
 
         if name:
             self.add_name(name, name_class=ORGANISATION_NAME)
@@ -2367,7 +3009,7 @@ class Organisation(ResponsibleActor):
             Post: _description_
         """
         if uri is None:
-            uri = self.tool._mint_dependent_uri(self.uri, "POST")
+            uri = self._mint_dependent_uri("POST")
         post = Post(tool=self.tool, uri=uri, start=start, end=end)
         if name is not None and name != "":
             post.add_name(name)
@@ -2380,6 +3022,9 @@ class ClassOfElement(RdfsClass, ExchangedItem):
     Python wrapper class for IES ClassOfElement
     """
 
+    __slots__ = ()
+    _default_classes = (CLASS_OF_ELEMENT,)
+
     def __init__(self, tool: IESTool = IES_TOOL, uri: str | None = None, classes: list[str] | None = None):
         """
             Instantiate the IES ClassOfElement
@@ -2392,8 +3037,6 @@ class ClassOfElement(RdfsClass, ExchangedItem):
             Returns:
                 ClassOfElement:
         """
-        if classes is None:
-            classes = [CLASS_OF_ELEMENT]
         super().__init__(tool=tool, uri=uri, classes=classes)
 
     def add_measure(self, value: str, measure_class: str | None = None,
@@ -2411,7 +3054,7 @@ class ClassOfElement(RdfsClass, ExchangedItem):
             tool=self.tool, value=value, uom=uom, uri=uri, classes=[measure_class]
         )
         self.tool.add_triple(subject=self._uri,
-                             predicate=f"{IES_BASE}allHaveCharacteristic",
+                             predicate=ALL_HAVE_CHARACTERISTIC,
                              obj=measure._uri)
 
 
@@ -2420,6 +3063,9 @@ class ClassOfClassOfElement(RdfsClass, ExchangedItem):
     Python wrapper class for IES ClassOfClassOfElement
     """
 
+    __slots__ = ()
+    _default_classes = (CLASS_OF_CLASS_OF_ELEMENT,)
+
     def __init__(self, tool: IESTool = IES_TOOL, uri: str = None, classes: list[str] | None = None):
         """
             Instantiate the IES ClassOfClassOfElement
@@ -2432,8 +3078,6 @@ class ClassOfClassOfElement(RdfsClass, ExchangedItem):
             Returns:
                 ClassOfClassOfElement:
         """
-        if classes is None:
-            classes = [CLASS_OF_CLASS_OF_ELEMENT]
         super().__init__(tool=tool, uri=uri, classes=classes)
 
 
@@ -2442,6 +3086,9 @@ class ParticularPeriod(Element):
     Python wrapper class for IES ParticularPeriod
     """
 
+    __slots__ = ()
+    _default_classes = (PARTICULAR_PERIOD,)
+
     def __init__(self, tool: IESTool = IES_TOOL, classes: list[str] | None = None, time_string: str = None):
         """
             Instantiate the IES ParticularPeriod
@@ -2453,18 +3100,14 @@ class ParticularPeriod(Element):
             Returns:
                 ParticularPeriod:
         """
-        if classes is None:
-            classes = [PARTICULAR_PERIOD]
         if not time_string:
             raise Exception("No time_string provided for ParticularPeriod")
 
-        iso8601_time_string = time_string.replace(" ", "T")
-        uri = f"http://iso.org/iso8601#{str(iso8601_time_string)}"
+        iso8601_time_string = str(time_string).replace(" ", "T")
 
-        super().__init__(tool=tool, uri=uri, classes=classes)
+        super().__init__(tool=tool, uri=f"{ISO8601}{iso8601_time_string}", classes=classes)
 
-        self.add_literal(predicate=f"{IES_BASE}iso8601PeriodRepresentation",
-                         literal=str(iso8601_time_string))
+        self.add_literal(predicate=ISO8601_PERIOD_REPRESENTATION, literal=iso8601_time_string)
 
 
 class BoundingState(State):
@@ -2472,6 +3115,9 @@ class BoundingState(State):
     Python wrapper class for IES BoundingState
     """
 
+    __slots__ = ()
+    _default_classes = (BOUNDING_STATE,)
+
     def __init__(self, tool: IESTool = IES_TOOL, uri: str | None = None, classes: list[str] | None = None):
         """
             Instantiate the IES BoundingState
@@ -2485,8 +3131,6 @@ class BoundingState(State):
                 BoundingState:
         """
 
-        if classes is None:
-            classes = [BOUNDING_STATE]
         super().__init__(tool=tool, uri=uri, classes=classes)
 
 
@@ -2495,6 +3139,9 @@ class BirthState(BoundingState):
     Python wrapper class for IES BirthState
     """
 
+    __slots__ = ()
+    _default_classes = (BIRTH_STATE,)
+
     def __init__(self, tool: IESTool = IES_TOOL, uri: str | None = None, classes: list[str] | None = None):
         """
             Instantiate the IES BirthState
@@ -2508,8 +3155,6 @@ class BirthState(BoundingState):
                 BirthState:
         """
 
-        if classes is None:
-            classes = [BIRTH_STATE]
         super().__init__(tool=tool, uri=uri, classes=classes)
 
 
@@ -2518,6 +3163,9 @@ class DeathState(BoundingState):
     Python wrapper class for IES DeathState
     """
 
+    __slots__ = ()
+    _default_classes = (DEATH_STATE,)
+
     def __init__(self, tool: IESTool = IES_TOOL, uri: str | None = None, classes: list[str] | None = None):
         """
             Instantiate the IES DeathState
@@ -2531,8 +3179,6 @@ class DeathState(BoundingState):
                 DeathState:
         """
 
-        if classes is None:
-            classes = [DEATH_STATE]
         super().__init__(tool=tool, uri=uri, classes=classes)
 
 
@@ -2541,6 +3187,9 @@ class UnitOfMeasure(ClassOfClassOfElement):
     Python wrapper class for IES UnitOfMeasure
     """
 
+    __slots__ = ()
+    _default_classes = (UNIT_OF_MEASURE,)
+
     def __init__(self, tool: IESTool = IES_TOOL, uri: str = None, classes: list[str] | None = None):
         """
             Instantiate the IES UnitOfMeasure
@@ -2554,8 +3203,6 @@ class UnitOfMeasure(ClassOfClassOfElement):
                 UnitOfMeasure:
         """
 
-        if classes is None:
-            classes = [UNIT_OF_MEASURE]
         super().__init__(tool=tool, classes=classes, uri=uri)
 
 
@@ -2564,6 +3211,9 @@ class Representation(ClassOfElement):
     Python wrapper class for IES Representation
     """
 
+    __slots__ = ()
+    _default_classes = (REPRESENTATION,)
+
     def __init__(self, tool: IESTool = IES_TOOL, representation_text: str | None = None, uri: str | None = None,
                  classes: list[str] | None = None, naming_scheme: NamingScheme | None = None):
         """
@@ -2579,17 +3229,15 @@ class Representation(ClassOfElement):
                 Representation:
         """
 
-        if classes is None:
-            classes = [REPRESENTATION]
-
         super().__init__(tool=tool, uri=uri, classes=classes)
 
+        triples = []
         if representation_text:
-            self.tool.add_triple(subject=self._uri, predicate=f"{IES_BASE}representationValue",
-                                 obj=representation_text, is_literal=True, literal_type="string")
+            triples.append((self._uri, REPRESENTATION_VALUE, representation_text, True, "string"))
         if naming_scheme:
-            self.tool.add_triple(subject=self._uri, predicate=f"{IES_BASE}inScheme",
-                                 obj=naming_scheme.uri)
+            triples.append((self._uri, IN_SCHEME, naming_scheme.uri))
+        if triples:
+            self.tool.add_triples(triples)
 
 
 class WorkOfDocumentation(Representation):
@@ -2597,6 +3245,9 @@ class WorkOfDocumentation(Representation):
     Python wrapper class for IES WorkOfDocumentation
     """
 
+    __slots__ = ()
+    _default_classes = (WORK_OF_DOCUMENTATION,)
+
     def __init__(self, tool: IESTool = IES_TOOL, uri: str | None = None,
                  classes: list[str] | None = None):
         """
@@ -2611,9 +3262,6 @@ class WorkOfDocumentation(Representation):
                 WorkOfDocumentation:
         """
 
-        if classes is None:
-            classes = [WORK_OF_DOCUMENTATION]
-
         super().__init__(tool=tool, uri=uri, classes=classes)
 
 
@@ -2622,6 +3270,9 @@ class MeasureValue(Representation):
     Python wrapper class for IES MeasureValue
     """
 
+    __slots__ = ()
+    _default_classes = (MEASURE_VALUE,)
+
     def __init__(self, tool: IESTool = IES_TOOL, uri: str | None = None, classes: list[str] | None = None,
                  value: str | None = None, uom: UnitOfMeasure | None = None, measure: Measure | None = None):
         """
@@ -2638,18 +3289,18 @@ class MeasureValue(Representation):
                 MeasureValue:
         """
 
-        if classes is None:
-            classes = [MEASURE_VALUE]
         if not value:
             raise Exception("MeasureValue must have a valid value")
         super().__init__(tool=tool, representation_text=value, uri=uri, classes=classes, naming_scheme=None)
+        triples = []
         if uom is not None:
-            self.tool.add_triple(self._uri, f"{IES_BASE}measureUnit", obj=uom._uri)
+            triples.append((self._uri, MEASURE_UNIT, uom._uri))
         if measure is None:
             logger.warning("MeasureValue created without a corresponding measure")
         else:
-            self.tool.add_triple(subject=measure._uri, predicate=f"{IES_BASE}hasValue",
-                                 obj=self._uri)
+            triples.append((measure._uri, HAS_VALUE, self._uri))
+        if triples:
+            self.tool.add_triples(triples)
 
 
 class Measure(ClassOfElement):
@@ -2657,6 +3308,22 @@ class Measure(ClassOfElement):
     Python wrapper class for IES Measure
     """
 
+    __slots__ = ()
+    _default_classes = (MEASURE,)
+    measurements_map = types.MappingProxyType({
+        "Length": "ValueInMetres",
+        "Mass": "ValueInKilograms",
+        "Duration": "ValueInSeconds",
+        "ElectricCurrent": "ValueInAmperes",
+        "Temperature": "ValueInKelvin",
+        "AmountOfSubstance": "ValueInMoles",
+        "LuminousIntensity": "ValueInCandela"
+    })
+    # The same mapping, but between full class URIs, so __init__ needs no string manipulation
+    _value_classes = types.MappingProxyType({
+        f"{IES_BASE}{measure}": f"{IES_BASE}{value}" for measure, value in measurements_map.items()
+    })
+
     def __init__(
             self, tool: IESTool = IES_TOOL, uri: str | None = None, classes: list[str] | None = None,
             value: str = None, uom: UnitOfMeasure | None = None):
@@ -2670,29 +3337,17 @@ class Measure(ClassOfElement):
                 value (str): the value of the measure as a literal
                 uom (UnitOfMeasure): the unit of measure of the value applied to this measure
         """
-        self.measurements_map = {
-            "Length": "ValueInMetres",
-            "Mass": "ValueInKilograms",
-            "Duration": "ValueInSeconds",
-            "ElectricCurrent": "ValueInAmperes",
-            "Temperature": "ValueInKelvin",
-            "AmountOfSubstance": "ValueInMoles",
-            "LuminousIntensity": "ValueInCandela"
-        }
-
-        if classes is None:
-            classes = [MEASURE]
+        if not classes:
+            classes = self._default_classes
         if len(classes) != 1:
             logger.warning("Measure must be just one class, using the first one")
         _class = classes[0]
 
         super().__init__(tool=tool, uri=uri, classes=classes)
         value = str(value)
-        value_class = (f"{IES_BASE}"
-                       f"{self.measurements_map.get(_class.replace(IES_BASE, ''), MEASURE_VALUE[len(IES_BASE):])}"
-                       )
+        value_class = self._value_classes.get(_class, MEASURE_VALUE)
         if value_class != MEASURE_VALUE and uom is not None:
-            logger.warning("Standard measure: " + value_class + " do not require a unit of measure")
+            logger.warning("Standard measure: %s do not require a unit of measure", value_class)
 
         MeasureValue(tool=self.tool, value=value, uom=uom, measure=self, classes=[value_class])
 
@@ -2702,6 +3357,9 @@ class Identifier(Representation):
     Python wrapper class for IES Identifier
     """
 
+    __slots__ = ()
+    _default_classes = (IDENTIFIER,)
+
     def __init__(
             self, tool: IESTool = IES_TOOL, id_text="", uri: str | None = None, classes: list[str] | None = None,
             naming_scheme: NamingScheme = None
@@ -2718,8 +3376,6 @@ class Identifier(Representation):
                 Identifier:
         """
 
-        if classes is None:
-            classes = [IDENTIFIER]
         super().__init__(tool=tool, uri=uri, classes=classes, representation_text=id_text, naming_scheme=naming_scheme)
 
 
@@ -2728,6 +3384,9 @@ class Name(Representation):
     Python wrapper class for IES Name
     """
 
+    __slots__ = ()
+    _default_classes = (NAME,)
+
     def __init__(self, tool: IESTool = IES_TOOL, name_text="", uri: str | None = None,
                  classes: list[str] | None = None, naming_scheme: NamingScheme = None):
         """
@@ -2742,9 +3401,6 @@ class Name(Representation):
                 Name:
         """
 
-        if classes is None:
-            classes = [NAME]
-
         super().__init__(
             tool=tool, uri=uri, classes=classes, representation_text=name_text, naming_scheme=naming_scheme
         )
@@ -2755,6 +3411,9 @@ class NamingScheme(ClassOfClassOfElement):
     Python wrapper class for IES NamingScheme
     """
 
+    __slots__ = ()
+    _default_classes = (NAMING_SCHEME,)
+
     def __init__(self, tool: IESTool = IES_TOOL, owner: ResponsibleActor | None = None, uri: str | None = None,
                  classes: list[str] | None = None):
         """
@@ -2768,18 +3427,16 @@ class NamingScheme(ClassOfClassOfElement):
             Returns:
                 NamingScheme:
         """
-        if classes is None:
-            classes = [NAMING_SCHEME]
         super().__init__(tool=tool, uri=uri, classes=classes)
         if owner is not None:
             self.tool.add_triple(
-                subject=self._uri, predicate=f"{IES_BASE}schemeOwner", obj=owner._uri
+                subject=self._uri, predicate=SCHEME_OWNER, obj=owner._uri
             )
 
     def add_mastering_system(self, system: Entity):
         if system is not None:
             self.tool.add_triple(
-                subject=self._uri, predicate=f"{IES_BASE}schemeMasteredIn", obj=system._uri
+                subject=self._uri, predicate=SCHEME_MASTERED_IN, obj=system._uri
             )
 
 
@@ -2788,6 +3445,9 @@ class Event(Element):
     Python wrapper class for IES class Event
     """
 
+    __slots__ = ()
+    _default_classes = (EVENT,)
+
     def __init__(self, tool: IESTool = IES_TOOL, uri: str | None = None, classes: list[str] | None = None,
                  start: str | None = None, end: str | None = None):
         """
@@ -2804,8 +3464,6 @@ class Event(Element):
                 Event:
         """
 
-        if classes is None:
-            classes = [EVENT]
         super().__init__(tool=tool, uri=uri, classes=classes, start=start, end=end)
 
     def add_participant(self,
@@ -2813,8 +3471,9 @@ class Event(Element):
                         uri: str | None = None,
                         participation_type: str | None = None,
                         start: str | None = None,
-                        end: str | None = None
-                        ) -> EventParticipant:
+                        end: str | None = None,
+                        return_object: bool = True
+                        ) -> EventParticipant | None:
         """
         Adds a participant to the Event
 
@@ -2827,24 +3486,31 @@ class Event(Element):
             Defaults to None.
             end (str | None, optional): an ISO8601 datetime string that marks the end of the participation.
             Defaults to None.
+            return_object (bool, optional): Set to False when the EventParticipant isn't needed - if there is no start
+            or end, its triples are then written directly, without creating (or caching) a Python object.
+            Defaults to True.
 
         Returns:
-            EventParticipant:
+            EventParticipant | None: None if return_object is False
         """
 
-        pe_object = self._validate_referenced_object(participating_entity, Entity, "add_participant")
+        pe_uri = self._referenced_uri(participating_entity, Entity, "add_participant")
 
         if uri is None:
             uri = self.tool.generate_data_uri()
 
         if participation_type is None:
-            participation_type = f"{IES_BASE}EventParticipant"
+            participation_type = EVENT_PARTICIPANT
 
-        participant = EventParticipant(tool=self.tool, uri=uri, start=start, end=end, classes=[participation_type])
+        participation_triples = [(uri, IS_PARTICIPANT_IN, self._uri), (uri, IS_PARTICIPATION_OF, pe_uri)]
+        if not return_object and start is None and end is None:
+            self.tool.add_triples([(uri, RDF_TYPE, participation_type), *participation_triples])
+            return None
 
-        self.tool.add_triple(participant._uri, f"{IES_BASE}isParticipantIn", self._uri)
-        self.tool.add_triple(participant._uri, f"{IES_BASE}isParticipationOf", pe_object._uri)
-        return participant
+        participant = EventParticipant(tool=self.tool, uri=uri, start=start, end=end, classes=[participation_type])
+        self.tool.add_triples(participation_triples)
+        if return_object:
+            return participant
 
 
 class EventParticipant(State):
@@ -2852,6 +3518,9 @@ class EventParticipant(State):
     Python wrapper class for IES EventParticipant
     """
 
+    __slots__ = ()
+    _default_classes = (EVENT_PARTICIPANT,)
+
     def __init__(self, tool: IESTool = IES_TOOL, uri: str | None = None, classes: list[str] | None = None,
                  start: str | None = None, end: str | None = None):
         """
@@ -2868,8 +3537,6 @@ class EventParticipant(State):
                 EventParticipant:
         """
 
-        if classes is None:
-            classes = [EVENT_PARTICIPANT]
         super().__init__(tool=tool, start=start, end=end, uri=uri, classes=classes)
 
 
@@ -2878,6 +3545,9 @@ class Communication(Event):
     Python wrapper class for IES Communication
     """
 
+    __slots__ = ()
+    _default_classes = (COMMUNICATION,)
+
     def __init__(self, tool: IESTool = IES_TOOL, uri: str | None = None, classes: list[str] | None = None,
                  start: str | None = None, end: str | None = None,
                  message_content: str | None = None):
@@ -2895,15 +3565,13 @@ class Communication(Event):
                 Communication:
         """
 
-        if classes is None:
-            classes = [COMMUNICATION]
         super().__init__(tool=tool, uri=uri, classes=classes, start=start, end=end)
 
         if message_content:
-            self.add_literal(f"{IES_BASE}messageContent", message_content)
+            self.add_literal(MESSAGE_CONTENT, message_content)
 
     def create_party(self, uri: str | None = None, party_role: str | None = None, start: str | None = None,
-                     end: str | None = None) -> PartyInCommunication:
+                     end: str | None = None, validate: bool = True) -> PartyInCommunication:
         """Creates a PartyInCommunication instance and relates it to the Communication instance
 
         Args:
@@ -2911,14 +3579,16 @@ class Communication(Event):
             party_role (str | None, optional): Use this to select a subclass of PartyInCommunication. Defaults to None.
             start (str | None, optional): ISO8601 string - the start of the party's involvement. Defaults to None.
             end (str | None, optional): ISO8601 string - the end of the party's involvement. Defaults to None.
+            validate (bool, optional): Check party_role against the ontology. Set to False for bulk loads where the
+                role is known to be good. Defaults to True.
 
         Returns:
             PartyInCommunication: the PartyInCommunication instance
         """
-        party_role = party_role or f"{IES_BASE}PartyInCommunication"
-
-        if party_role not in self.tool.ontology.pic_subtypes:
-            logger.warning(f"{party_role} is not a subtype of ies:PartyInCommunication")
+        if not party_role:
+            party_role = PARTY_IN_COMMUNICATION
+        elif validate and party_role not in self.tool.ontology.pic_subtypes:
+            logger.warning("%s is not a subtype of ies:PartyInCommunication", party_role)
 
         party = PartyInCommunication(tool=self.tool, uri=uri, communication=self,
                                      start=start, end=end, classes=[party_role])
@@ -2939,7 +3609,7 @@ class Communication(Event):
             PartyInCommunication: the PartyInCommunication instance
         """
         logger.warning("add_party() is deprecated - please use create_party()")
-        return self.add_party(uri=uri, party_role=party_role, starts_in=starts_in, ends_in=ends_in)
+        return self.create_party(uri=uri, party_role=party_role, start=starts_in, end=ends_in)
 
 
 class PartyInCommunication(Event):
@@ -2947,6 +3617,9 @@ class PartyInCommunication(Event):
     Python wrapper class for IES PartyInCommunication
     """
 
+    __slots__ = ()
+    _default_classes = (PARTY_IN_COMMUNICATION,)
+
     def __init__(self, tool: IESTool | None = IES_TOOL, uri: str | None = None, classes: list[str] | None = None,
                  communication: Event | None = None, start: str | None = None,
                  end: str | None = None):
@@ -2964,54 +3637,48 @@ class PartyInCommunication(Event):
                 PartyInCommunication:
         """
 
-        if classes is None:
-            classes = [PARTY_IN_COMMUNICATION]
-
         super().__init__(tool=tool, uri=uri, classes=classes, start=start, end=end)
         if communication is not None:
             communication.add_part(self)
 
-    def add_account(self, account: Account | str, uri: str | None = None) -> EventParticipant:
+    def _add_party_participant(self, participant: RdfsResource | str, context: str, postfix: str,
+                               participant_class: str, uri: str | None = None) -> EventParticipant:
         """
-        Adds an Account to the PartyInCommunication
+        Creates an EventParticipant of the PartyInCommunication for another item - the pattern shared by
+        add_account(), add_device() and add_person()
 
         Args:
-            account (Account|str): the account (or referred URI) to add
+            participant (RdfsResource | str): the participating item (or referred URI, which is used as it is)
+            context (str): The calling method, for debugging output
+            postfix (str): The postfix used to mint the EventParticipant URI
+            participant_class (str): The IES class of the EventParticipant
             uri (str | None, optional): Use to override the uri of the created EventParticipant. Defaults to None.
 
         Returns:
             EventParticipant:
         """
+        participant_uri = self._referenced_uri(participant, context=context)
         if uri is None:
-            uri = self.tool._mint_dependent_uri(self.uri, "ACCOUNT")
-
-        account_object = self._validate_referenced_object(account, Event, "add_account")
+            uri = self._mint_dependent_uri(postfix)
+        event_participant = EventParticipant(tool=self.tool, uri=uri, classes=[participant_class])
+        self.tool.add_triples([
+            (event_participant._uri, IS_PARTICIPANT_IN, self._uri),
+            (event_participant._uri, IS_PARTICIPATION_OF, participant_uri)
+        ])
+        return event_participant
 
-        try:
-
-            aic = EventParticipant(
-                tool=self.tool, uri=uri,
-                classes=[f"{IES_BASE}AccountInCommunication"]
-            )
-
-            self.tool.add_triple(
-                aic._uri,
-                f"{IES_BASE}isParticipantIn",
-                self._uri
-            )
-
-            self.tool.add_triple(
-                aic._uri,
-                f"{IES_BASE}isParticipationOf",
-                account_object._uri
-            )
+    def add_account(self, account: Account | str, uri: str | None = None) -> EventParticipant:
+        """
+        Adds an Account to the PartyInCommunication
 
-            return aic
+        Args:
+            account (Account|str): the account (or referred URI) to add
+            uri (str | None, optional): Use to override the uri of the created EventParticipant. Defaults to None.
 
-        except AttributeError as e:
-            logger.warning(
-                f"Exception occurred while trying to add account, no account will be added."
-                f" {repr(e)}")
+        Returns:
+            EventParticipant:
+        """
+        return self._add_party_participant(account, "add_account", "ACCOUNT", ACCOUNT_IN_COMMUNICATION, uri)
 
     def add_device(self, device: Device | str, uri: str | None = None) -> EventParticipant:
         """
@@ -3024,31 +3691,7 @@ class PartyInCommunication(Event):
         Returns:
             EventParticipant:
         """
-        device_object = self._validate_referenced_object(device, Device, "add_device")
-        if uri is None:
-            uri = self.tool._mint_dependent_uri(self.uri, "DEVICE")
-        try:
-            dic = EventParticipant(
-                tool=self.tool, uri=uri,
-                classes=[f"{IES_BASE}DeviceInCommunication"]
-            )
-            self.tool.add_triple(
-                dic._uri,
-                f"{IES_BASE}isParticipantIn",
-                self._uri)
-            self.tool.add_triple(
-                dic._uri,
-                f"{IES_BASE}isParticipationOf",
-                device_object._uri)
-
-
-        except AttributeError as e:
-            logger.warning(
-                f"Exception occurred while trying to add device, no device will be added."
-                f" {repr(e)}"
-            )
-
-        return dic
+        return self._add_party_participant(device, "add_device", "DEVICE", DEVICE_IN_COMMUNICATION, uri)
 
     def add_person(self, person: Person | str, uri: str | None = None) -> EventParticipant:
         """
@@ -3061,28 +3704,6 @@ class PartyInCommunication(Event):
         Returns:
             EventParticipant:
         """
-        person_object = self._validate_referenced_object(person, Person, "add_person")
-        if uri is None:
-            uri = self.tool._mint_dependent_uri(self.uri, "PERSON")
-        try:
-            pic = EventParticipant(
-                tool=self.tool, uri=uri,
-                classes=[f"{IES_BASE}PersonInCommunication"]
-            )
-            self.tool.add_triple(
-                pic._uri,
-                f"{IES_BASE}isParticipantIn",
-                self._uri)
-            self.tool.add_triple(
-                pic._uri,
-                f"{IES_BASE}isParticipationOf",
-                person_object._uri)
-            return pic
-        except AttributeError as e:
-            logger.warning(
-                f"Exception occurred while trying to add person, no person will be added."
-                f" {repr(e)}"
-            )
-
+        return self._add_party_participant(person, "add_person", "PERSON", PERSON_IN_COMMUNICATION, uri)
 
 IES_TOOL = IESTool()
@@ -15,7 +15,7 @@ def validate_datetime_string(func):
         except ValueError as exc:
             # Using the logger from the class instance 'self'
             if hasattr(self, 'logger'):
-                self.logger.error(f'invalid ISO8601 datetime string: {time_string}')
+                self.logger.error('invalid ISO8601 datetime string: %s', time_string)
             raise RuntimeError(f'invalid ISO8601 datetime string: {time_string}') from exc
         return func(self, time_string, *args, **kwargs)
     return wrapper
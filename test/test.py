@@ -1,8 +1,25 @@
-import time
 from unittest import TestCase
 from unittest.mock import mock_open, patch
 
-from ies_tool.ies_tool import IES_TOOL, Communication, Element, Entity, Event, GeoPoint, IESTool, Organisation, Person
+import requests
+from geohash_tools import encode
+from rdflib import XSD, Literal, URIRef
+
+from ies_tool.ies_tool import (
+    BIRTH_STATE,
+    IES_TOOL,
+    Account,
+    Communication,
+    Country,
+    Element,
+    Entity,
+    Event,
+    GeoPoint,
+    IESTool,
+    Measure,
+    Organisation,
+    Person,
+)
 
 
 def sparql_test():
@@ -13,67 +30,76 @@ def sparql_test():
     IES_TOOL.add_to_graph("http://a","http://t","test literal",True)
     out = IES_TOOL.run_sparql_query("SELECT * WHERE { <http://a> ?p ?o } LIMIT 4")
     print(out)
-    IES_TOOL.delete_triple("http://a",IES_TOOL.rdf_type,"http://x")
-    IES_TOOL.delete_triple("http://a","http://b","http://c")
-    IES_TOOL.delete_triple("http://a","http://y","http://z")
-    IES_TOOL.delete_triple("http://a","http://t","test literal",True)
-    time.sleep(1)
+    IES_TOOL.delete_triples([
+        ("http://a", IES_TOOL.rdf_type, "http://x"),
+        ("http://a", "http://b", "http://c"),
+        ("http://a", "http://y", "http://z"),
+        ("http://a", "http://t", "test literal", True, "string")
+    ])
     out = IES_TOOL.run_sparql_query("SELECT * WHERE { <http://a> ?p ?o } LIMIT 4")
     print(out)
 
 
 def run_test(tool=IES_TOOL):
+    device_state = tool.ontology.ies_class("DeviceState")
     for c in tool.ontology.classes:
-        inst = tool.instantiate([c])
-        if isinstance(inst, Element):
-            # obviously, this will be wrong for most classes, but we're just testing performance
-            inst.create_state(start="2004-01-01", end="2006-01-01")
-        for _ in range(50):
-            dev = Entity(tool=tool, classes=["http://ies.data.gov.uk/ontology/ies4#Device"])
-            dev.create_state(state_type=tool.ontology.ies_class("DeviceState"), start="2014-03-11", end="2022-08-30")
+        with tool.batch():
+            inst = tool.instantiate([c])
+            if isinstance(inst, Element):
+                # obviously, this will be wrong for most classes, but we're just testing performance
+                inst.create_state(start="2004-01-01", end="2006-01-01")
+            for _ in range(50):
+                dev = Entity(tool=tool, classes=["http://ies.data.gov.uk/ontology/ies4#Device"])
+                dev.create_state(state_type=device_state, start="2014-03-11", end="2022-08-30")
         tool.get_rdf()
         tool.clear_graph()
 
 
 def test_anne_person():
     IES_TOOL.clear_graph()
-    anne = Person(given_name="Anne", surname="Smith", date_of_birth="1492-01-13")
-    anne.add_measure(measure_class=IES_TOOL.ontology.ies_class("Mass"), value=104)
+    with IES_TOOL.batch():
+        anne = Person(given_name="Anne", surname="Smith", date_of_birth="1492-01-13")
+        anne.add_measure(measure_class=IES_TOOL.ontology.ies_class("Mass"), value=104)
 
-    anne.add_identifier("blah")
-    anne.add_name("blah name")
-    anne.add_label("Anne Label")
-    anne.add_representation("blah rep")
+        anne.add_identifier("blah")
+        anne.add_name("blah name")
+        anne.add_label("Anne Label")
+        anne.add_representation("blah rep")
 
-    IES_TOOL.instantiate(
-        ["http://ies.data.gov.uk/ontology/ies4#Device", "http://ies.data.gov.uk/ontology/ies4#Person"]
-    )
+        IES_TOOL.instantiate(
+            ["http://ies.data.gov.uk/ontology/ies4#Device", "http://ies.data.gov.uk/ontology/ies4#Person"]
+        )
 
-    gp = GeoPoint(lat=52.41419458448101, lon=16.899256413657202, precision=9)
-    e = Event(end="1999-09-09")
-    e.add_participant(anne)
+        gp = GeoPoint(lat=52.41419458448101, lon=16.899256413657202, precision=9)
+        e = Event(end="1999-09-09")
+        e.add_participant(anne)
 
-    acme = Organisation(name="ACME inc")
-    acme_director = acme.create_post(name="Witchfinder General", start="1612-01-01")
-    acme.add_part("http://test#part1") #A test to see if dumb URIs can be passed
+        acme = Organisation(name="ACME inc")
+        acme_director = acme.create_post(name="Witchfinder General", start="1612-01-01")
+        acme.add_part("http://test#part1") #A test to see if dumb URIs can be passed
 
-    anne.add_birth("1984-01-01", gp)
-    anne.add_death("2017-08-11", gp)
-    anne.create_state()
-    anne.works_for(acme, "2011-03-11", "2017-06-20")
+        anne.add_birth("1984-01-01", gp)
+        anne.add_death("2017-08-11", gp)
+        anne.create_state()
+        anne.works_for(acme, "2011-03-11", "2017-06-20")
 
-    anne.in_post(acme_director, start="2015-12-05", end="2017-06-20")
+        anne.in_post(acme_director, start="2015-12-05", end="2017-06-20")
 
-    comm = Communication()
-    comm.add_participant(anne)
-    comm.add_participant("http://test#particpant1")
+        comm = Communication()
+        comm.add_participant(anne)
+        comm.add_participant("http://test#particpant1")
     IES_TOOL.save_rdf('./test-anne.ttl', rdf_format="ttl")
 
 
 class MainTestCase(TestCase):
 
+    @classmethod
+    def setUpClass(cls):
+        # One tool for the whole class, so the ontology is only loaded once. Validation is tested on its own tool.
+        cls.tool = IESTool()
+
     def setUp(self):
-        self.tool = IESTool(validate=True)
+        self.tool.clear_graph()
 
     @staticmethod
     def test_anne_person():
@@ -83,11 +109,327 @@ class MainTestCase(TestCase):
 
     def test_no_dob_on_person_when_none(self):
         Person(tool=self.tool, given_name="Anne", surname="Smith")
-        self.assertTrue('BIRTH' not in str(self.tool.get_rdf()))
+        self.assertNotIn((None, URIRef(self.tool.rdf_type), URIRef(BIRTH_STATE)), self.tool.graph)
 
     def test_dob_on_person_when_given(self):
         Person(tool=self.tool, given_name="Anne", surname="Smith", start='1970-01-01')
-        self.assertTrue('BIRTH' in str(self.tool.get_rdf()))
+        self.assertIn((None, URIRef(self.tool.rdf_type), URIRef(BIRTH_STATE)), self.tool.graph)
+
+    def test_conflicting_birth_arguments_add_nothing(self):
+        with self.assertRaisesRegex(Exception, "date_of_birth"):
+            Person(tool=self.tool, given_name="Anne", start="1970-01-01", date_of_birth="1970-01-01")
+        self.assertEqual(len(self.tool.graph), 0)
+
+    def test_family_name_is_used_as_surname(self):
+        Person(tool=self.tool, given_name="Anne", family_name="Smith")
+        self.assertIn((None, None, Literal("Smith", datatype=XSD.string)), self.tool.graph)
+
+    def test_get_rdf_validates_when_enabled(self):
+        tool = IESTool(validate=True)
+        Person(tool=tool, given_name="Anne")
+        with patch("pyshacl.validate", return_value=(False, None, "not valid")) as shacl:
+            self.assertEqual(tool.get_rdf()["validation_errors"], "not valid")
+            shacl.assert_called_once()
+            self.tool.get_rdf()
+            shacl.assert_called_once()
+
+    def test_no_type_asserted_for_referenced_uri(self):
+        org = Organisation(tool=self.tool, name="ACME inc")
+        org.add_part("http://test#part1")
+        self.assertFalse((URIRef("http://test#part1"), URIRef(self.tool.rdf_type), None) in self.tool.graph)
+
+    def test_empty_classes_use_the_default_class(self):
+        for obj in (Person(tool=self.tool, classes=[]), Country(tool=self.tool, country_alpha_3_code="GBR", classes=[]),
+                    Measure(tool=self.tool, classes=[], value="1")):
+            self.assertIn((URIRef(obj.uri), URIRef(self.tool.rdf_type), URIRef(obj._default_classes[0])),
+                          self.tool.graph)
+
+    def test_resources_compare_by_uri(self):
+        anne = Person(tool=self.tool, uri="http://example.com/rdf/testdata#anne", given_name="Anne")
+        self.assertEqual(anne, "http://example.com/rdf/testdata#anne")
+        self.assertIn("http://example.com/rdf/testdata#anne", {anne})
+        self.assertNotEqual(anne, Person(tool=self.tool, given_name="Bob"))
+
+    def test_wrappers_have_no_instance_dict(self):
+        # A single class in the hierarchy without __slots__ would silently give every subclass a __dict__ again
+        for obj in (Person(tool=self.tool, given_name="Anne"), Communication(tool=self.tool),
+                    GeoPoint(tool=self.tool, lat=0.0, lon=0.0, precision=6)):
+            self.assertFalse(hasattr(obj, "__dict__"), type(obj).__name__)
+
+    def test_add_triples(self):
+        self.tool.add_triples([
+            ("http://a", "http://b", "http://c"),
+            ("http://a", "http://d", "42", True, "integer"),
+            ("http://a", "http://e", "2024-01-01", True, XSD.date),
+        ])
+        self.assertIn((URIRef("http://a"), URIRef("http://b"), URIRef("http://c")), self.tool.graph)
+        self.assertIn((URIRef("http://a"), URIRef("http://d"), Literal(42)), self.tool.graph)
+        self.assertIn((URIRef("http://a"), URIRef("http://e"), Literal("2024-01-01", datatype=XSD.date)),
+                      self.tool.graph)
+
+    def test_batch_defers_triples(self):
+        with self.tool.batch():
+            anne = Person(tool=self.tool, given_name="Anne", surname="Smith")
+            self.assertEqual(len(self.tool.graph), 0)
+        self.assertIn((URIRef(anne.uri), URIRef(self.tool.rdf_type), None), self.tool.graph)
+        self.assertEqual(len(self.tool.graph), 7)
+
+    def test_failed_batch_flush_leaves_batch_mode(self):
+        with patch.object(self.tool, "_make_rdflib_triple", side_effect=RuntimeError("flush failed")), \
+                self.assertRaises(RuntimeError), self.tool.batch():
+            Person(tool=self.tool, given_name="Anne")
+        anne = Person(tool=self.tool, given_name="Anne")
+        self.assertIn((URIRef(anne.uri), URIRef(self.tool.rdf_type), None), self.tool.graph)
+
+    def test_deprecated_add_party_creates_party(self):
+        comm = Communication(tool=self.tool)
+        party = comm.add_party(starts_in="2020-01-01")
+        self.assertIn((URIRef(party.uri), None, URIRef(comm.uri)), self.tool.graph)
+
+    def test_party_participants(self):
+        party = Communication(tool=self.tool).create_party()
+        person = party.add_person(Person(tool=self.tool, given_name="Anne"))
+        account = party.add_account("http://example.com/rdf/testdata#account1")
+        self.assertEqual(person.uri, f"{party.uri}_PERSON_001")
+        self.assertIn((URIRef(account.uri), None, URIRef("http://example.com/rdf/testdata#account1")), self.tool.graph)
+        self.assertIn((URIRef(account.uri), None, URIRef(party.uri)), self.tool.graph)
+
+    def test_add_participant_without_object(self):
+        event = Event(tool=self.tool)
+        anne = Person(tool=self.tool, given_name="Anne")
+        with_object = set(self.tool.graph)
+        event.add_participant(anne, uri="http://example.com/rdf/testdata#p1")
+        expected = set(self.tool.graph) - with_object
+        self.tool.graph.remove((URIRef("http://example.com/rdf/testdata#p1"), None, None))
+        self.assertIsNone(event.add_participant(anne, uri="http://example.com/rdf/testdata#p1", return_object=False))
+        self.assertEqual(set(self.tool.graph) - with_object, expected)
+
+    def test_measure_value_classes(self):
+        ies = "http://ies.data.gov.uk/ontology/ies4#"
+        Measure(tool=self.tool, classes=[f"{ies}Mass"], value=104)
+        Measure(tool=self.tool, classes=[f"{ies}Measure"], value=3)
+        self.assertIn((None, URIRef(self.tool.rdf_type), URIRef(f"{ies}ValueInKilograms")), self.tool.graph)
+        self.assertIn((None, URIRef(self.tool.rdf_type), URIRef(f"{ies}MeasureValue")), self.tool.graph)
+
+    def test_dependent_uris_are_numbered_in_sequence(self):
+        anne = Person(tool=self.tool, uri="http://example.com/rdf/testdata#anne")
+        Entity(tool=self.tool, uri="http://example.com/rdf/testdata#anne_GIVENNAME_002")
+        uris = [anne.add_given_name("Anne").uri for _ in range(3)]
+        self.assertEqual(uris, [f"http://example.com/rdf/testdata#anne_GIVENNAME_{n}" for n in ("001", "003", "004")])
+
+    def test_dependent_uri_counters_are_bounded(self):
+        anne = Person(tool=self.tool, uri="http://example.com/rdf/testdata#anne")
+        self.assertEqual(anne.add_given_name("Anne").uri, "http://example.com/rdf/testdata#anne_GIVENNAME_001")
+        with patch("ies_tool.ies_tool.STEM_COUNTER_LIMIT", 1):
+            Person(tool=self.tool, uri="http://example.com/rdf/testdata#bob").add_given_name("Bob")
+            self.assertEqual(len(self.tool._stem_counters), 1)
+            self.assertEqual(anne.add_given_name("Anne").uri, "http://example.com/rdf/testdata#anne_GIVENNAME_002")
+
+    def test_in_graph(self):
+        anne = Person(tool=self.tool, given_name="Anne")
+        given_name_uri = f"{anne.uri}_GIVENNAME_001"
+        self.assertTrue(self.tool.in_graph(anne.uri, self.tool.rdf_type, "http://ies.data.gov.uk/ontology/ies4#Person"))
+        self.assertTrue(self.tool.in_graph(given_name_uri, "http://ies.data.gov.uk/ontology/ies4#representationValue",
+                                           "Anne", is_literal=True))
+        self.assertFalse(self.tool.in_graph(anne.uri, self.tool.rdf_type, "http://ies.data.gov.uk/ontology/ies4#Event"))
+
+    def test_batch_flushes_every_n_triples(self):
+        with self.tool.batch(flush_every=5):
+            Person(tool=self.tool, given_name="Anne", surname="Smith")
+            self.assertGreaterEqual(len(self.tool.graph), 5)
+            self.assertLess(len(self.tool.graph), 7)
+        self.assertEqual(len(self.tool.graph), 7)
+
+    def test_registered_email_address(self):
+        account = Account(tool=self.tool)
+        self.assertEqual(account.add_registered_email_address("fred.smith@fakedomain.int").uri,
+                         "https://ietf.org/rfc5322#fred.smith@fakedomain.int")
+        self.assertFalse(account.add_registered_email_address("not an email").uri.startswith("https://ietf.org"))
+        bad = account.add_registered_email_address('a<b>"{x@ex.com')
+        self.assertFalse(bad.uri.startswith("https://ietf.org"))
+        self.tool.graph.serialize(format="nt")
+
+    def test_geopoint_uri_matches_geohash_tools(self):
+        for lat, lon in [(52.41419458448101, 16.899256413657202), (0.0, 0.0), (45.0, 90.0), (-33.8688, 151.2093)]:
+            gp = GeoPoint(tool=self.tool, lat=lat, lon=lon, precision=9)
+            self.assertEqual(gp.uri, f"http://geohash.org/{encode(lat, lon, precision=9)}")
+
+    def test_add_geopoints_matches_geopoint(self):
+        coordinates = [(52.41419458448101, 16.899256413657202), (-33.8688, 151.2093)]
+        for lat, lon in coordinates:
+            GeoPoint(tool=self.tool, lat=lat, lon=lon, precision=9)
+        expected = set(self.tool.graph)
+        self.tool.clear_graph()
+        uris = self.tool.add_geopoints(coordinates, precision=9)
+        self.assertEqual(uris, [f"http://geohash.org/{encode(lat, lon, precision=9)}" for lat, lon in coordinates])
+        self.assertEqual(set(self.tool.graph), expected)
+
+    def test_country_is_only_created_once(self):
+        gbr = self.tool.country("GBR")
+        triple_count = len(self.tool.graph)
+        self.assertIsInstance(gbr, Country)
+        self.assertIs(self.tool.country("GBR"), gbr)
+        self.assertEqual(len(self.tool.graph), triple_count)
+
+    def test_particular_period_is_only_created_once(self):
+        period = self.tool.particular_period("2015-12-05 10:00:00")
+        self.assertEqual(period.uri, "http://iso.org/iso8601#2015-12-05T10:00:00")
+        self.assertIs(self.tool.particular_period("2015-12-05T10:00:00"), period)
+
+    def test_failed_init_is_not_registered(self):
+        uri = "http://example.com/rdf/testdata#bad_dob"
+        with self.assertRaises(RuntimeError):
+            Person(tool=self.tool, uri=uri, given_name="Anne", date_of_birth="not a date")
+        self.assertNotIn(uri, self.tool.instances)
+
+    def test_labels_are_queried_from_rdflib_graph(self):
+        anne = Person(tool=self.tool, given_name="Anne", surname="Smith")
+        anne.add_label("Anne Smith")
+        self.assertEqual(anne.labels, ["Anne Smith"])
+        self.assertEqual(anne.comments, [])
+
+    def test_generated_uris_follow_namespace_and_session(self):
+        first = self.tool.generate_data_uri("_x")
+        self.addCleanup(setattr, self.tool, "default_data_namespace", self.tool.default_data_namespace)
+        self.tool.default_data_namespace = "http://example.com/other#"
+        second = self.tool.generate_data_uri()
+        self.assertTrue(second.startswith(f"http://example.com/other#{self.tool.session_uuid_str}_"))
+        self.tool.clear_graph()
+        third = self.tool.generate_data_uri()
+        self.assertTrue(first.endswith("_x_000000"))
+        self.assertEqual(third, f"http://example.com/other#{self.tool.session_uuid_str}_000000")
+
+    def test_run_sparql_queries_keeps_order(self):
+        anne = Person(tool=self.tool, given_name="Anne", surname="Smith")
+        anne.add_label("Anne")
+        anne.add_comment("A person")
+        results = self.tool.run_sparql_queries([
+            f"SELECT ?o WHERE {{ <{anne.uri}> rdfs:{predicate} ?o }}" for predicate in ("label", "comment")
+        ])
+        self.assertEqual([r["results"]["bindings"][0]["o"]["value"] for r in results], ["Anne", "A person"])
+
+    def test_delete_triples(self):
+        anne = Person(tool=self.tool, given_name="Anne", surname="Smith")
+        anne.add_label("Anne")
+        self.tool.delete_triples([
+            (anne.uri, self.tool.rdf_type, Person._default_classes[0]),
+            (anne.uri, self.tool.rdfs_label, "Anne", True, "string")
+        ])
+        self.assertNotIn((URIRef(anne.uri), URIRef(self.tool.rdf_type), None), self.tool.graph)
+        self.assertNotIn((URIRef(anne.uri), URIRef(self.tool.rdfs_label), None), self.tool.graph)
+
+    def test_ies_class_accepts_prefixed_names(self):
+        self.assertEqual(self.tool.ontology.ies_class("ies:Person"), Person._default_classes[0])
+        with self.assertNoLogs("ies_tool.ies_ontology", level="WARNING"):
+            self.tool.ontology.ies_property("ies:hasName")
+
+    def test_ontology_is_shared_between_tools(self):
+        self.assertIs(IESTool().ontology, self.tool.ontology)
+
+    def test_invalid_uri_is_logged(self):
+        with self.assertLogs("ies_tool.ies_tool", level="ERROR"):
+            Person(tool=self.tool, uri="not a uri", given_name="Anne")
+        with self.assertNoLogs("ies_tool.ies_tool", level="ERROR"):
+            Person(tool=self.tool, uri="urn:example:anne", given_name="Anne")
+
+
+class SparqlServerTestCase(TestCase):
+
+    def setUp(self):
+        # requests.Session is replaced for every test, so sparql_server tools talk to a mock rather than a server
+        patcher = patch("requests.Session")
+        self.http = patcher.start().return_value
+        self.addCleanup(patcher.stop)
+
+    def test_sparql_batch_size_groups_inserts(self):
+        tool = IESTool(mode="sparql_server", sparql_batch_size=5)
+        self.http.get.return_value.content = b'{"results": {"bindings": []}}'
+        for i in range(12):
+            tool.add_triple(f"http://example.com/s{i}", tool.rdfs_label, f"label {i}", is_literal=True)
+        self.assertEqual(self.http.post.call_count, 2)
+        tool.run_sparql_query("SELECT * WHERE { ?s ?p ?o }")
+        self.assertEqual(self.http.post.call_count, 3)
+        self.assertEqual(self.http.post.call_args.kwargs["data"].count(b"label "), 2)
+        self.assertIn(b'"label 11"^^<http://www.w3.org/2001/XMLSchema#string>',
+                      self.http.post.call_args.kwargs["data"])
+
+    def test_insert_data_escapes_literals(self):
+        tool = IESTool(mode="sparql_server")
+        tool.add_triples([("http://example.com/s", tool.rdfs_label, 'say "hi" \\ bye\nnow', True, "string")])
+        self.assertIn(b'"say \\"hi\\" \\\\ bye\\nnow"^^<http://www.w3.org/2001/XMLSchema#string>',
+                      self.http.post.call_args.kwargs["data"])
+        self.http.post.return_value.raise_for_status.side_effect = requests.HTTPError("400 Client Error")
+        with self.assertRaises(requests.HTTPError):
+            tool.add_triples([("http://example.com/s", tool.rdf_type, "http://example.com/C")])
+
+    def test_batch_flush_escapes_literals_and_raises_on_rejected_update(self):
+        tool = IESTool(mode="sparql_server")
+        with tool.batch():
+            tool.add_triple("http://example.com/anne", tool.rdfs_label, 'Anne "Annie"', is_literal=True)
+            tool.add_triple("http://example.com/anne", tool.rdfs_comment, "Smith\nJones", is_literal=True)
+        self.assertEqual(self.http.post.call_count, 1)
+        self.assertIn(b'"Anne \\"Annie\\""', self.http.post.call_args.kwargs["data"])
+        self.assertIn(b'"Smith\\nJones"', self.http.post.call_args.kwargs["data"])
+        self.http.post.return_value.raise_for_status.side_effect = requests.HTTPError("400 Client Error")
+        with self.assertRaises(requests.HTTPError), tool.batch():
+            tool.add_triple("http://example.com/bob", tool.rdf_type, "http://example.com/C")
+
+    def test_unflushed_sparql_batch_is_reported(self):
+        tool = IESTool(mode="sparql_server", sparql_batch_size=5)
+        tool.add_triple("http://example.com/s", tool.rdf_type, "http://example.com/C")
+        with self.assertLogs("ies_tool.ies_tool", level="WARNING"):
+            del tool
+
+    def test_unreachable_sparql_server(self):
+        self.http.get.side_effect = requests.Timeout()
+        with self.assertRaisesRegex(RuntimeError, "Could not connect"):
+            IESTool(mode="sparql_server")
+
+    def test_long_sparql_queries_are_posted(self):
+        tool = IESTool(mode="sparql_server")
+        self.http.get.return_value.content = self.http.post.return_value.content = b'{"results": {"bindings": []}}'
+        tool.run_sparql_query("SELECT * WHERE { ?s ?p ?o }")
+        self.assertEqual(self.http.post.call_count, 0)
+        tool.run_sparql_query("SELECT * WHERE { ?s ?p ?o } " + "#" * 2000)
+        self.assertEqual(self.http.post.call_args.args[0], "http://localhost:3030/ds/query")
+        self.assertIn("query", self.http.post.call_args.kwargs["data"])
+
+    def test_graph_store_upload_falls_back_to_insert_data(self):
+        tool = IESTool(mode="sparql_server", graph_store_upload=True)
+        self.http.post.return_value.status_code = 200
+        tool.add_triple("http://example.com/s", tool.rdfs_label, 'say "hi"', is_literal=True)
+        self.assertEqual(self.http.post.call_args.kwargs["headers"]["Content-Type"], "application/n-triples")
+        self.assertIn(b'"say \\"hi\\""^^<http://www.w3.org/2001/XMLSchema#string> .',
+                      self.http.post.call_args.kwargs["data"])
+        self.http.post.return_value.status_code = 415
+        tool.add_triple("http://example.com/s", tool.rdfs_label, 'say "bye"', is_literal=True)
+        self.assertEqual(self.http.post.call_args.kwargs["headers"]["Content-Type"], "application/sparql-update")
+        self.assertIn(b"INSERT DATA", self.http.post.call_args.kwargs["data"])
+        self.assertIn(b'"say \\"bye\\""^^<http://www.w3.org/2001/XMLSchema#string>',
+                      self.http.post.call_args.kwargs["data"])
+
+    def test_failed_graph_store_upload_is_retried_with_insert_data(self):
+        tool = IESTool(mode="sparql_server", graph_store_upload=True)
+        self.http.post.return_value.status_code = 413
+        with self.assertLogs("ies_tool.ies_tool", level="WARNING"):
+            tool.add_triple("http://example.com/s", tool.rdf_type, "http://example.com/C")
+        self.assertEqual(self.http.post.call_count, 2)
+        self.assertIn(b"INSERT DATA", self.http.post.call_args.kwargs["data"])
+        self.http.post.return_value.status_code = 204
+        tool.add_triple("http://example.com/s", tool.rdf_type, "http://example.com/D")
+        self.assertEqual(self.http.post.call_args.kwargs["headers"]["Content-Type"], "application/n-triples")
+
+    def test_graph_store_upload_and_insert_data_send_the_same_security_label(self):
+        tool = IESTool(mode="sparql_server", graph_store_upload=True, default_security_label="label")
+        self.http.post.return_value.status_code = 200
+        tool.add_triple("http://example.com/s", tool.rdf_type, "http://example.com/C")
+        self.assertEqual(self.http.post.call_args.kwargs["headers"]["Security-Label"], "label")
+        self.http.post.return_value.status_code = 405
+        tool.add_triple("http://example.com/s", tool.rdf_type, "http://example.com/D")
+        self.assertIn(b"INSERT DATA", self.http.post.call_args.kwargs["data"])
+        self.assertEqual(self.http.post.call_args.kwargs["headers"]["Security-Label"], "label")
+        tool.add_triples([("http://example.com/s", tool.rdf_type, "http://example.com/E")])
+        self.assertEqual(self.http.post.call_args.kwargs["headers"]["Security-Label"], "label")
 
 
 if __name__ == '__main__':